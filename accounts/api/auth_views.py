@@ -4,6 +4,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth.hashers import check_password, make_password
+from django.db import transaction
 from django.utils import timezone
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
@@ -18,10 +20,54 @@ from ..serializers import (
     ChangePasswordSerializer,
 )
 from ..models import Account, Wallet
+from ..services.profile_service import ProfileService
+from ..tasks import touch_last_login
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Verified against on unknown emails so both login branches cost one hash check
+DUMMY_PASSWORD_HASH = make_password("dummy-password-for-timing")
+
+# Shared transport so cert fetches reuse one pooled HTTPS connection to
+# Google instead of a new session (and TLS handshake) per login
+_GOOGLE_REQUEST = google_requests.Request()
+_GOOGLE_CLIENT_ID = (
+    settings.SOCIALACCOUNT_PROVIDERS.get("google", {}).get("APP", {}).get("client_id")
+)
+
+def record_last_login(user):
+    """
+    Stamp the login time on the user and persist it via Celery, so the
+    UPDATE is not part of the login response time.
+    Writes directly when no broker is configured or it is unavailable:
+    publishing without one would block on kombu's connection retries.
+    """
+    user.last_login = timezone.now()
+    if getattr(settings, "CELERY_BROKER_URL", None):
+        try:
+            touch_last_login.apply_async(
+                (user.id, user.last_login.isoformat()), retry=False
+            )
+            return
+        except Exception as e:
+            logger.warning(f"Could not queue last login update for user {user.id}: {str(e)}")
+    # Plain UPDATE: no model save, signals or auto_now handling
+    User.objects.filter(pk=user.pk).update(last_login=user.last_login)
+
+
+def create_demo_account(user):
+    """Create the default demo account and its wallet for a new user"""
+    account = Account.objects.create(
+        user=user,
+        account_number=f"D{user.id:08d}",
+        account_type="demo",
+        balance=10000.00,
+        status="active",
+    )
+    Wallet.objects.create(account=account)
+    return account
+
 
 def get_tokens_for_user(user):
     """Generate JWT tokens for user"""
@@ -49,18 +95,10 @@ def register_view(request):
     """
     serializer = RegisterSerializer(data=request.data)
     if serializer.is_valid():
-        user = serializer.save(request)
-
-        # Create demo account automatically
-        account_number = f"D{user.id:08d}"
-        account = Account.objects.create(
-            user=user,
-            account_number=account_number,
-            account_type="demo",
-            balance=10000.00,
-            status="active",
-        )
-        Wallet.objects.create(account=account)
+        # User, demo account and wallet are created together or not at all
+        with transaction.atomic():
+            user = serializer.save(request)
+            create_demo_account(user)
 
         # Generate tokens
         tokens = get_tokens_for_user(user)
@@ -96,14 +134,16 @@ def login_view(request):
     email = serializer.validated_data["email"].lower()
     password = serializer.validated_data["password"]
 
-    try:
-        user = User.objects.get(email=email)
-    except User.DoesNotExist:
-        return Response(
-            {"error": "Invalid email or password"}, status=status.HTTP_401_UNAUTHORIZED
-        )
+    # Run a hash verify even for unknown emails so response time does not
+    # reveal which emails are registered
+    user = User.objects.filter(email=email).first()
+    if user is None:
+        check_password(password, DUMMY_PASSWORD_HASH)
+        password_valid = False
+    else:
+        password_valid = user.check_password(password)
 
-    if not user.check_password(password):
+    if not password_valid:
         return Response(
             {"error": "Invalid email or password"}, status=status.HTTP_401_UNAUTHORIZED
         )
@@ -114,8 +154,7 @@ def login_view(request):
         )
 
     # Update last login
-    user.last_login_at = timezone.now()
-    user.save(update_fields=["last_login_at"])
+    record_last_login(user)
 
     # Generate tokens
     tokens = get_tokens_for_user(user)
@@ -146,13 +185,17 @@ def google_auth_view(request):
 
     token = serializer.validated_data["access_token"]
 
+    # Without a client id the audience check would be skipped
+    if not _GOOGLE_CLIENT_ID:
+        logger.error("Google auth error: SOCIALACCOUNT_PROVIDERS google client_id not set")
+        return Response(
+            {"error": "Google authentication is not configured"},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
     try:
         # Verify Google token
-        idinfo = id_token.verify_oauth2_token(
-            token,
-            google_requests.Request(),
-            settings.SOCIALACCOUNT_PROVIDERS["google"]["APP"]["client_id"],
-        )
+        idinfo = id_token.verify_oauth2_token(token, _GOOGLE_REQUEST, _GOOGLE_CLIENT_ID)
 
         if idinfo["iss"] not in ["accounts.google.com", "https://accounts.google.com"]:
             raise ValueError("Wrong issuer")
@@ -165,40 +208,32 @@ def google_auth_view(request):
 
         # Check if user exists
         user = None
-        try:
-            user = User.objects.get(google_id=google_id)
-        except User.DoesNotExist:
+        with transaction.atomic():
             try:
-                # Check by email
-                user = User.objects.get(email=email)
-                user.google_id = google_id
-                user.avatar = avatar
-                user.save()
+                user = User.objects.get(google_id=google_id)
             except User.DoesNotExist:
-                # Create new user
-                user = User.objects.create_user(
-                    email=email,
-                    first_name=first_name,
-                    last_name=last_name,
-                    google_id=google_id,
-                    avatar=avatar,
-                    is_verified=True,  # Google verified
-                )
-
-                # Create demo account
-                account_number = f"D{user.id:08d}"
-                account = Account.objects.create(
-                    user=user,
-                    account_number=account_number,
-                    account_type="demo",
-                    balance=10000.00,
-                    status="active",
-                )
-                Wallet.objects.create(account=account)
+                try:
+                    # Check by email
+                    user = User.objects.get(email=email)
+                    user.google_id = google_id
+                    user.avatar = avatar
+                    user.save()
+                except User.DoesNotExist:
+                    # Create new user
+                    user = User.objects.create_user(
+                        email=email,
+                        first_name=first_name,
+                        last_name=last_name,
+                        google_id=google_id,
+                        avatar=avatar,
+                        is_verified=True,  # Google verified
+                    )
+
+                    # Create demo account
+                    create_demo_account(user)
 
         # Update last login
-        user.last_login_at = timezone.now()
-        user.save(update_fields=["last_login_at"])
+        record_last_login(user)
 
         # Generate tokens
         tokens = get_tokens_for_user(user)
@@ -252,8 +287,11 @@ def user_profile_view(request):
 
     GET /api/auth/profile/
     """
-    serializer = UserDetailSerializer(request.user)
-    return Response(serializer.data)
+    user = request.user
+    data = ProfileService.get_profile(
+        user.id, lambda: dict(UserDetailSerializer(user).data)
+    )
+    return Response(data)
 
 
 @api_view(["PATCH"])
@@ -272,6 +310,8 @@ def update_profile_view(request):
     serializer = UserDetailSerializer(request.user, data=request.data, partial=True)
     if serializer.is_valid():
         serializer.save()
+        # Refresh the cached profile with the data just serialized
+        ProfileService.store_profile(request.user.id, dict(serializer.data))
         return Response(
             {"message": "Profile updated successfully", "user": serializer.data}
         )
@@ -2,19 +2,75 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from ..models import Deposit, Account
-from ..serializers import DepositSerializer, DepositRequestSerializer
+from django.db import transaction
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from ..models import Deposit, Account, Transaction
+from ..serializers import (
+    DepositSerializer,
+    DepositListSerializer,
+    DepositRequestSerializer,
+)
 from ..services.deposit_service import DepositService
 
 
+# Static parts of the payment instructions; only amount/id vary per deposit
+_CRYPTO_INSTRUCTIONS = {
+    "crypto_btc": {
+        "address": "bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh",
+        "network": "Bitcoin",
+        "note": "Send exact amount to the address above",
+    },
+    "crypto_eth": {
+        "address": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
+        "network": "Ethereum",
+        "note": "Send exact amount to the address above",
+    },
+}
+_CARD_METHODS = frozenset({"visa", "mastercard"})
+_CARD_NOTE = "You will be redirected to secure payment page"
+_DEFAULT_NOTE = "Please contact support for payment instructions"
+
+
+@extend_schema_view(
+    list=extend_schema(responses=DepositSerializer(many=True)),
+    pending=extend_schema(responses=DepositSerializer(many=True)),
+)
 class DepositViewSet(viewsets.ModelViewSet):
 
     serializer_class = DepositSerializer
     permission_classes = [IsAuthenticated]
+    serialized_fields = (
+        "id",
+        "account",
+        "account__account_number",
+        "transaction",
+        "payment_method",
+        "amount",
+        "currency",
+        "status",
+        "gateway_transaction_id",
+        "crypto_address",
+        "crypto_txid",
+        "created_at",
+        "completed_at",
+    )
 
     def get_queryset(self):
-        accounts = Account.objects.filter(user=self.request.user)
-        return Deposit.objects.filter(account__in=accounts).order_by("-created_at")
+        # Filter through the FK instead of a separate Account subquery and
+        # join the account row the serializer (account_number) reads.
+        # Only the serialized columns are loaded (no gateway JSON blobs).
+        return (
+            Deposit.objects.filter(account__user=self.request.user)
+            .select_related("account")
+            .only(*self.serialized_fields)
+            .order_by("-created_at")
+        )
+
+    def get_serializer_class(self):
+        # Read-only list output skips the ModelSerializer field machinery
+        if self.action in ("list", "pending"):
+            return DepositListSerializer
+        return DepositSerializer
 
     def create(self, request, *args, **kwargs):
         """Create deposit request"""
@@ -50,44 +106,35 @@ class DepositViewSet(viewsets.ModelViewSet):
 
     def _get_payment_instructions(self, deposit):
         """Generate payment instructions based on method"""
-        if deposit.payment_method == "crypto_btc":
-            return {
-                "address": "bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh",
-                "amount": str(deposit.amount),
-                "network": "Bitcoin",
-                "note": "Send exact amount to the address above",
-            }
-        elif deposit.payment_method == "crypto_eth":
-            return {
-                "address": "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
-                "amount": str(deposit.amount),
-                "network": "Ethereum",
-                "note": "Send exact amount to the address above",
-            }
-        elif deposit.payment_method in ["visa", "mastercard"]:
+        template = _CRYPTO_INSTRUCTIONS.get(deposit.payment_method)
+        if template is not None:
+            return {**template, "amount": str(deposit.amount)}
+        if deposit.payment_method in _CARD_METHODS:
             return {
                 "redirect_url": f"/payment/card/{deposit.id}",
-                "note": "You will be redirected to secure payment page",
+                "note": _CARD_NOTE,
             }
-        else:
-            return {"note": "Please contact support for payment instructions"}
+        return {"note": _DEFAULT_NOTE}
 
     @action(detail=True, methods=["post"])
     def cancel(self, request, pk=None):
         """Cancel pending deposit"""
         deposit = self.get_object()
 
-        if deposit.status != "pending":
-            return Response(
-                {"error": "Only pending deposits can be cancelled"},
-                status=status.HTTP_400_BAD_REQUEST,
+        # Conditional UPDATE: a concurrent cancel or completion leaves
+        # zero rows matched instead of overwriting the newer status
+        with transaction.atomic():
+            updated = Deposit.objects.filter(pk=deposit.pk, status="pending").update(
+                status="cancelled"
+            )
+            if not updated:
+                return Response(
+                    {"error": "Only pending deposits can be cancelled"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            Transaction.objects.filter(pk=deposit.transaction_id).update(
+                status="cancelled"
             )
-
-        deposit.status = "cancelled"
-        deposit.save()
-
-        deposit.transaction.status = "cancelled"
-        deposit.transaction.save()
 
         return Response({"status": "cancelled"})
 
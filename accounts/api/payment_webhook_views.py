@@ -7,10 +7,11 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.conf import settings
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-import json
 import logging
+import orjson
 
 try:
     from ..services.payment_gateway_service import PaymentGatewayService
@@ -23,6 +24,11 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import rather than through the lazy settings wrapper per call
+_WEBHOOK_SECRETS = getattr(settings, 'PAYMENT_GATEWAY_SECRETS', {})
+# Signature headers in lookup order (gateway-specific)
+_SIG_HEADERS = ('HTTP_X_SIGNATURE', 'HTTP_X_WEBHOOK_SIGNATURE')
+
 
 @method_decorator(csrf_exempt, name='dispatch')
 class PaymentWebhookView(APIView):
@@ -31,6 +37,8 @@ class PaymentWebhookView(APIView):
     CSRF exempt because webhooks come from external services.
     """
     permission_classes = [AllowAny]
+    # Body is read raw: it is parsed once below and the HMAC runs over it
+    parser_classes = []
 
     @extend_schema(
         summary="Payment Gateway Webhook",
@@ -56,20 +64,32 @@ class PaymentWebhookView(APIView):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         
+        raw = request.body
+        try:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            payload = None
+        if not isinstance(payload, dict):
+            return Response(
+                {'error': 'Invalid webhook payload'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
             # Get signature from headers (gateway-specific)
-            signature = request.META.get('HTTP_X_SIGNATURE') or request.META.get('HTTP_X_WEBHOOK_SIGNATURE')
+            meta = request.META
+            signature = next((meta[h] for h in _SIG_HEADERS if meta.get(h)), None)
             
             # Get secret key from settings (should be in environment)
-            from django.conf import settings
-            secret_key = getattr(settings, 'PAYMENT_GATEWAY_SECRETS', {}).get(gateway_name)
+            secret_key = _WEBHOOK_SECRETS.get(gateway_name)
             
             # Process webhook
             result = PaymentGatewayService.process_deposit_webhook(
                 gateway_name=gateway_name,
-                payload=request.data if isinstance(request.data, dict) else json.loads(request.body),
+                payload=payload,
                 signature=signature,
-                secret_key=secret_key
+                secret_key=secret_key,
+                raw=raw
             )
             
             return Response(result, status=status.HTTP_200_OK)
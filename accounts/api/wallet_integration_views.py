@@ -3,8 +3,14 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from ..services.wallet_service import WalletService
+from ..services.account_service import AccountService
 from ..models import Account
-from common.exceptions import InsufficientBalanceError, AccountSuspendedError, RiskLimitExceeded, DailyLossLimitExceeded
+from ..serializers import (
+    WalletLockInputSerializer,
+    WalletReleaseInputSerializer,
+    WalletApplyPnLInputSerializer,
+)
+from common.exceptions import InsufficientBalanceError, AccountSuspendedError, RiskLimitExceeded, DailyLossLimitExceeded, AccountBusyError
 
 
 class WalletLockView(APIView):
@@ -24,38 +30,24 @@ class WalletLockView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        account_id = request.data.get("account_id")
-        amount = request.data.get("amount")
-        trade_id = request.data.get("trade_id")
-        description = request.data.get("description", "")
+        serializer = WalletLockInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
 
-        if not all([account_id, amount, trade_id]):
-            return Response(
-                {"error": "account_id, amount, and trade_id required"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        account_id = data["account_id"]
+        amount = data["amount"]
+        trade_id = data["trade_id"]
+        description = data["description"]
 
         try:
-            account = Account.objects.get(id=account_id, user=request.user)
+            AccountService.get_account_for_user(request.user.id, account_id)
         except Account.DoesNotExist:
             return Response(
                 {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Daily Loss QA: Check if daily loss limit exceeded before locking balance
-        daily_loss_ok = WalletService.check_daily_loss_limit(account)
-        if not daily_loss_ok:
-            return Response(
-                {
-                    "error": f"Daily loss limit exceeded. Current: {account.daily_loss_current}, Limit: {account.max_daily_loss}. Balance locking rejected.",
-                    "code": "RISK_LIMIT_EXCEEDED",
-                    "daily_loss_current": str(account.daily_loss_current),
-                    "daily_loss_max": str(account.max_daily_loss)
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
         try:
+            # Status, daily loss and balance are checked by lock_balance's UPDATE
             txn = WalletService.lock_balance(
                 account_id=account_id,
                 amount=amount,
@@ -67,11 +59,25 @@ class WalletLockView(APIView):
                 {
                     "status": "success",
                     "transaction_id": txn.id,
-                    "locked_amount": amount,
-                    "available_balance": account.available_balance,
+                    "locked_amount": str(amount),
+                    "available_balance": txn.account.available_balance,
                 }
             )
-        except (InsufficientBalanceError, AccountSuspendedError, RiskLimitExceeded, DailyLossLimitExceeded) as e:
+        except Account.DoesNotExist:
+            # Deleted or moved after the ownership check
+            return Response(
+                {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        except DailyLossLimitExceeded as e:
+            return Response(
+                {
+                    "error": str(e),
+                    "code": "RISK_LIMIT_EXCEEDED",
+                    **e.details,
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except (InsufficientBalanceError, AccountSuspendedError, RiskLimitExceeded) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -91,37 +97,45 @@ class WalletReleaseView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        account_id = request.data.get("account_id")
-        amount = request.data.get("amount")
-        trade_id = request.data.get("trade_id")
-        description = request.data.get("description", "")
+        serializer = WalletReleaseInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        account_id = data["account_id"]
+        amount = data["amount"]
+        trade_id = data["trade_id"]
+        description = data["description"]
 
-        if not all([account_id, amount, trade_id]):
+        try:
+            AccountService.get_account_for_user(request.user.id, account_id)
+        except Account.DoesNotExist:
             return Response(
-                {"error": "account_id, amount, and trade_id required"},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
         try:
-            account = Account.objects.get(id=account_id, user=request.user)
+            txn = WalletService.release_balance(
+                account_id=account_id,
+                amount=amount,
+                trade_id=trade_id,
+                description=description,
+            )
+        except AccountBusyError as e:
+            return Response(
+                {"error": str(e), "code": e.code}, status=status.HTTP_409_CONFLICT
+            )
         except Account.DoesNotExist:
+            # Deleted or moved after the ownership check
             return Response(
                 {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        txn = WalletService.release_balance(
-            account_id=account_id,
-            amount=amount,
-            trade_id=trade_id,
-            description=description,
-        )
-
         return Response(
             {
                 "status": "success",
                 "transaction_id": txn.id,
-                "released_amount": amount,
-                "available_balance": account.available_balance,
+                "released_amount": str(amount),
+                "available_balance": txn.account.available_balance,
             }
         )
 
@@ -143,39 +157,48 @@ class WalletApplyPnLView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        account_id = request.data.get("account_id")
-        pnl_amount = request.data.get("pnl_amount")
-        trade_id = request.data.get("trade_id")
-        description = request.data.get("description", "")
+        serializer = WalletApplyPnLInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        account_id = data["account_id"]
+        pnl_amount = data["pnl_amount"]
+        trade_id = data["trade_id"]
+        description = data["description"]
 
-        if not all([account_id, pnl_amount, trade_id]):
+        try:
+            AccountService.get_account_for_user(request.user.id, account_id)
+        except Account.DoesNotExist:
             return Response(
-                {"error": "account_id, pnl_amount, and trade_id required"},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
         try:
-            account = Account.objects.get(id=account_id, user=request.user)
+            txn = WalletService.apply_pnl(
+                account_id=account_id,
+                pnl_amount=pnl_amount,
+                trade_id=trade_id,
+                description=description,
+            )
+        except AccountBusyError as e:
+            return Response(
+                {"error": str(e), "code": e.code}, status=status.HTTP_409_CONFLICT
+            )
         except Account.DoesNotExist:
+            # Deleted or moved after the ownership check
             return Response(
                 {"error": "Account not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        txn = WalletService.apply_pnl(
-            account_id=account_id,
-            pnl_amount=pnl_amount,
-            trade_id=trade_id,
-            description=description,
-        )
-
-        # Check if daily loss limit exceeded
+        # Check if daily loss limit exceeded (txn.account is the updated row)
+        account = txn.account
         exceeded = not WalletService.check_daily_loss_limit(account)
 
         return Response(
             {
                 "status": "success",
                 "transaction_id": txn.id,
-                "pnl_amount": pnl_amount,
+                "pnl_amount": str(pnl_amount),
                 "new_balance": account.balance,
                 "daily_loss_current": account.daily_loss_current,
                 "daily_loss_limit_exceeded": exceeded,
@@ -2,12 +2,22 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from ..models import Withdrawal, Account
-from ..serializers import WithdrawalSerializer, WithdrawalRequestSerializer
+from django.db import transaction
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from ..models import Withdrawal, Account, Transaction
+from ..serializers import (
+    WithdrawalSerializer,
+    WithdrawalListSerializer,
+    WithdrawalRequestSerializer,
+)
 from ..services.withdrawal_service import WithdrawalService
 from common.exceptions import InsufficientBalanceError
 
 
+@extend_schema_view(
+    list=extend_schema(responses=WithdrawalSerializer(many=True)),
+    pending=extend_schema(responses=WithdrawalSerializer(many=True)),
+)
 class WithdrawalViewSet(viewsets.ModelViewSet):
     """
     Withdrawal Management API
@@ -22,10 +32,37 @@ class WithdrawalViewSet(viewsets.ModelViewSet):
 
     serializer_class = WithdrawalSerializer
     permission_classes = [IsAuthenticated]
+    serialized_fields = (
+        "id",
+        "account",
+        "account__account_number",
+        "transaction",
+        "payment_method",
+        "amount",
+        "fee",
+        "net_amount",
+        "currency",
+        "destination_address",
+        "status",
+        "rejection_reason",
+        "created_at",
+        "completed_at",
+    )
 
     def get_queryset(self):
-        accounts = Account.objects.filter(user=self.request.user)
-        return Withdrawal.objects.filter(account__in=accounts).order_by("-created_at")
+        # Same query shape as DepositViewSet.get_queryset
+        return (
+            Withdrawal.objects.filter(account__user=self.request.user)
+            .select_related("account")
+            .only(*self.serialized_fields)
+            .order_by("-created_at")
+        )
+
+    def get_serializer_class(self):
+        # Read-only list output skips the ModelSerializer field machinery
+        if self.action in ("list", "pending"):
+            return WithdrawalListSerializer
+        return WithdrawalSerializer
 
     def create(self, request, *args, **kwargs):
         """Create withdrawal request"""
@@ -74,17 +111,20 @@ class WithdrawalViewSet(viewsets.ModelViewSet):
         """Cancel pending withdrawal"""
         withdrawal = self.get_object()
 
-        if withdrawal.status != "pending":
-            return Response(
-                {"error": "Only pending withdrawals can be cancelled"},
-                status=status.HTTP_400_BAD_REQUEST,
+        # Conditional UPDATE: a concurrent cancel or completion leaves
+        # zero rows matched instead of overwriting the newer status
+        with transaction.atomic():
+            updated = Withdrawal.objects.filter(pk=withdrawal.pk, status="pending").update(
+                status="cancelled"
+            )
+            if not updated:
+                return Response(
+                    {"error": "Only pending withdrawals can be cancelled"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            Transaction.objects.filter(pk=withdrawal.transaction_id).update(
+                status="cancelled"
             )
-
-        withdrawal.status = "cancelled"
-        withdrawal.save()
-
-        withdrawal.transaction.status = "cancelled"
-        withdrawal.transaction.save()
 
         return Response({"status": "cancelled"})
 
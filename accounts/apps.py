@@ -4,7 +4,11 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     name = 'accounts'
     default_auto_field = 'django.db.models.BigAutoField'
-    
+    _signals_loaded = False
+
     def ready(self):
-        """Import signals when app is ready"""
+        """Import signals once at startup (ready() can run more than once)"""
+        if self._signals_loaded:
+            return
         import accounts.signals  # noqa
+        self._signals_loaded = True
@@ -0,0 +1,17 @@
+"""
+Password hashers
+Argon2id tuned so check_password stays around 100-250 ms per verify.
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with a 64 MiB memory cost.
+    Keeps the "argon2" algorithm name, so hashes created with Django's
+    default parameters are still verified and rehashed on next login.
+    """
+
+    time_cost = 2
+    memory_cost = 64 * 1024  # KiB
+    parallelism = 1
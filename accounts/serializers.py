@@ -259,6 +259,38 @@ class DepositSerializer(serializers.ModelSerializer):
         ]
 
 
+# Output-only helpers for the list serializers below (one field instance
+# per process instead of one per serializer)
+_DATETIME_FIELD = serializers.DateTimeField(read_only=True)
+
+
+def _datetime(value):
+    return _DATETIME_FIELD.to_representation(value) if value else None
+
+
+class DepositListSerializer(serializers.BaseSerializer):
+    """
+    Read-only deposit serializer for list/pending endpoints.
+    Builds the same payload as DepositSerializer without DRF's per-field
+    attribute resolution. Expects account to be select_related.
+    """
+
+    def to_representation(self, instance):
+        return {
+            "id": str(instance.id),
+            "account_number": instance.account.account_number,
+            "payment_method": instance.payment_method,
+            "amount": format(instance.amount, "f"),
+            "currency": instance.currency,
+            "status": instance.status,
+            "gateway_transaction_id": instance.gateway_transaction_id,
+            "crypto_address": instance.crypto_address,
+            "crypto_txid": instance.crypto_txid,
+            "created_at": _datetime(instance.created_at),
+            "completed_at": _datetime(instance.completed_at),
+        }
+
+
 class WithdrawalRequestSerializer(serializers.Serializer):
     account_id = serializers.UUIDField()
     payment_method = serializers.ChoiceField(
@@ -295,6 +327,52 @@ class WithdrawalSerializer(serializers.ModelSerializer):
         ]
 
 
+class WithdrawalListSerializer(serializers.BaseSerializer):
+    """
+    Read-only withdrawal serializer for list/pending endpoints.
+    Builds the same payload as WithdrawalSerializer without DRF's per-field
+    attribute resolution. Expects account to be select_related.
+    """
+
+    def to_representation(self, instance):
+        return {
+            "id": str(instance.id),
+            "account_number": instance.account.account_number,
+            "payment_method": instance.payment_method,
+            "amount": format(instance.amount, "f"),
+            "fee": format(instance.fee, "f"),
+            "net_amount": format(instance.net_amount, "f"),
+            "currency": instance.currency,
+            "destination_address": instance.destination_address,
+            "status": instance.status,
+            "rejection_reason": instance.rejection_reason,
+            "created_at": _datetime(instance.created_at),
+            "completed_at": _datetime(instance.completed_at),
+        }
+
+
+# Wallet integration input (used by Backend 1). Amounts are accepted at up
+# to 8 places and rounded to the 2-place columns by WalletService.
+class WalletLockInputSerializer(serializers.Serializer):
+    account_id = serializers.UUIDField()
+    amount = serializers.DecimalField(
+        max_digits=20, decimal_places=8, min_value=Decimal("0.01")
+    )
+    trade_id = serializers.UUIDField()
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class WalletReleaseInputSerializer(WalletLockInputSerializer):
+    pass
+
+
+class WalletApplyPnLInputSerializer(serializers.Serializer):
+    account_id = serializers.UUIDField()
+    pnl_amount = serializers.DecimalField(max_digits=20, decimal_places=8)
+    trade_id = serializers.UUIDField()
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+
+
 class RiskLimitSerializer(serializers.ModelSerializer):
     class Meta:
         model = RiskLimit
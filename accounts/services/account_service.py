@@ -1,6 +1,7 @@
 """
 Account Service - Handles account switching and mode synchronization
 """
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from decimal import Decimal
@@ -8,6 +9,7 @@ from typing import Optional, Dict, Any
 import logging
 
 from ..models import Account, User
+from common.cache import is_shared_cache
 from common.enums import AccountType, ComplianceMode, CalmMode
 from common.exceptions import InvalidAccountTypeError, AccountSuspendedError
 
@@ -17,6 +19,41 @@ logger = logging.getLogger(__name__)
 class AccountService:
     """Service for managing account switching and mode synchronization"""
 
+    OWNERSHIP_CACHE_TTL = 60  # seconds
+    OWNERSHIP_CACHE_PREFIX = "acct"
+
+    @staticmethod
+    def ownership_cache_key(user_id, account_id) -> str:
+        """Cache key for the (user, account) ownership lookup"""
+        return f"{AccountService.OWNERSHIP_CACHE_PREFIX}:{user_id}:{account_id}"
+
+    @staticmethod
+    def get_account_for_user(user_id, account_id) -> Account:
+        """
+        Resolve an account owned by the user, cached for a short TTL.
+
+        Only identity columns are cached; balances must be re-read under
+        select_for_update inside WalletService before they are used.
+        The cache is only used when it is shared between workers: this is
+        an authorization check, and a per-process entry would outlive the
+        invalidation sent by the worker that moved or deleted the account.
+
+        Raises:
+            Account.DoesNotExist: If the account does not belong to the user
+        """
+        def lookup():
+            return Account.objects.only(
+                "id", "user", "account_number", "account_type"
+            ).get(id=account_id, user_id=user_id)
+
+        if not is_shared_cache():
+            return lookup()
+        return cache.get_or_set(
+            AccountService.ownership_cache_key(user_id, account_id),
+            lookup,
+            timeout=AccountService.OWNERSHIP_CACHE_TTL,
+        )
+
     @staticmethod
     @transaction.atomic
     def switch_account(
@@ -4,7 +4,7 @@ Payment Gateway Service - Handles external payment gateway webhooks
 from django.db import transaction
 from django.utils import timezone
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import logging
 import hmac
 import hashlib
@@ -23,7 +23,7 @@ class PaymentGatewayService:
 
     @staticmethod
     def verify_webhook_signature(
-        payload: str,
+        payload: Union[bytes, str],
         signature: str,
         secret_key: str
     ) -> bool:
@@ -31,7 +31,7 @@ class PaymentGatewayService:
         Verify webhook signature to ensure request authenticity.
         
         Args:
-            payload: Raw request body
+            payload: Raw request body (bytes as received, or str)
             signature: Signature from headers
             secret_key: Secret key for verification
         
@@ -39,10 +39,13 @@ class PaymentGatewayService:
             bool: True if signature is valid
         """
         try:
+            if isinstance(payload, str):
+                payload = payload.encode('utf-8')
+
             # Generate expected signature
             expected_signature = hmac.new(
                 secret_key.encode('utf-8'),
-                payload.encode('utf-8'),
+                payload,
                 hashlib.sha256
             ).hexdigest()
             
@@ -58,7 +61,8 @@ class PaymentGatewayService:
         gateway_name: str,
         payload: Dict[str, Any],
         signature: Optional[str] = None,
-        secret_key: Optional[str] = None
+        secret_key: Optional[str] = None,
+        raw: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Process deposit webhook from external payment gateway.
@@ -68,15 +72,18 @@ class PaymentGatewayService:
             payload: Webhook payload
             signature: Webhook signature for verification
             secret_key: Secret key for signature verification
+            raw: Exact request body the gateway signed
         
         Returns:
             Dict with processing result
         """
         # Verify signature if provided
         if signature and secret_key:
-            payload_str = json.dumps(payload, sort_keys=True)
+            # Gateways sign the bytes they sent; re-serializing the parsed
+            # payload only matches when no raw body is available
+            signed = raw if raw is not None else json.dumps(payload, sort_keys=True)
             if not PaymentGatewayService.verify_webhook_signature(
-                payload_str, signature, secret_key
+                signed, signature, secret_key
             ):
                 raise SecurityException(
                     "Invalid webhook signature",
@@ -0,0 +1,51 @@
+"""
+Profile Service - Caches the serialized user profile
+"""
+from django.core.cache import caches
+
+from common.cache import is_shared_cache
+
+
+class ProfileService:
+    """
+    Serialized profile cache for /api/auth/profile/.
+
+    Only used with a cache shared between workers: a per-process cache
+    would keep serving the old profile from every worker that did not
+    handle the update. Entries are dropped by accounts.signals.
+    """
+
+    CACHE_TTL = 900  # seconds
+    CACHE_PREFIX = "user_profile"
+
+    @staticmethod
+    def cache_key(user_id) -> str:
+        """Cache key for the serialized profile of a user"""
+        return f"{ProfileService.CACHE_PREFIX}:{user_id}"
+
+    @staticmethod
+    def cache_enabled() -> bool:
+        """True if the default cache is shared between workers"""
+        return is_shared_cache()
+
+    @staticmethod
+    def get_profile(user_id, build) -> dict:
+        """Cached profile, or build() when not cached (or caching is off)"""
+        if not ProfileService.cache_enabled():
+            return build()
+        return caches["default"].get_or_set(
+            ProfileService.cache_key(user_id), build, timeout=ProfileService.CACHE_TTL
+        )
+
+    @staticmethod
+    def store_profile(user_id, data: dict):
+        """Replace the cached profile with freshly serialized data"""
+        if ProfileService.cache_enabled():
+            caches["default"].set(
+                ProfileService.cache_key(user_id), data, timeout=ProfileService.CACHE_TTL
+            )
+
+    @staticmethod
+    def invalidate(user_id):
+        """Drop the cached profile"""
+        caches["default"].delete(ProfileService.cache_key(user_id))
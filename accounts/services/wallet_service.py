@@ -1,13 +1,32 @@
-from django.db import transaction
+from django.db import OperationalError, transaction
 from django.utils import timezone
-from decimal import Decimal
-from django.db.models import Sum
+from decimal import Decimal, ROUND_HALF_UP
+from django.db.models import Case, F, Q, Sum, When
 import logging
 import time
+from datetime import date
 from typing import Optional, Dict, Any
 from ..models import Account, Wallet, Transaction
+from ..signals import notify_balance_update
 from common.enums import TransactionType, TransactionStatus
-from common.exceptions import InsufficientBalanceError, AccountSuspendedError, PaymentGatewayError
+from common.exceptions import (
+    AccountBusyError,
+    InsufficientBalanceError,
+    AccountSuspendedError,
+    DailyLossLimitExceeded,
+    PaymentGatewayError,
+)
+
+
+# SQLSTATE lock_not_available, raised by FOR UPDATE NOWAIT on a locked row
+_LOCK_NOT_AVAILABLE = "55P03"
+
+_CENT = Decimal("0.01")
+
+
+def _to_cents(amount) -> Decimal:
+    """Round an amount to the 2-place balance columns (as numeric(18, 2) does)"""
+    return Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP)
 
 
 class WalletService:
@@ -18,34 +37,56 @@ class WalletService:
     def lock_balance(account_id, amount, trade_id, description=""):
         """
         Lock balance for trade margin.
-        
-        Uses select_for_update(skip_locked=True) to prevent deadlocks
-        in multi-user scenarios.
-        """
-        # Use skip_locked=True to prevent deadlocks when multiple users
-        # try to lock balance simultaneously
-        account = Account.objects.select_for_update(skip_locked=True).get(id=account_id)
 
-        if account.status != "active":
-            raise AccountSuspendedError(
-                f"Account {account.account_number} is {account.status}"
+        Status, daily loss limit and available balance are checked by the
+        same conditional UPDATE that locks the margin, so there is no
+        read-check-write window and no SELECT ... FOR UPDATE beforehand.
+        A stale daily loss counter (new day) is reset by that UPDATE too.
+        queryset.update() sends no post_save, so the real-time balance
+        update is sent here.
+        """
+        amount = _to_cents(amount)
+        today = date.today()
+
+        updated = (
+            Account.objects.filter(
+                id=account_id,
+                status="active",
+                balance__gte=F("locked_balance") + amount,
             )
-
-        if account.available_balance < amount:
-            raise InsufficientBalanceError(
-                f"Insufficient balance. Available: {account.available_balance}, Required: {amount}"
+            .filter(
+                Q(max_daily_loss__isnull=True)
+                | Q(max_daily_loss=0)
+                | Q(daily_loss_reset_date__lt=today)
+                | Q(daily_loss_current__lt=F("max_daily_loss"))
+            )
+            .update(
+                locked_balance=F("locked_balance") + amount,
+                daily_loss_current=Case(
+                    When(daily_loss_reset_date__lt=today, then=Decimal("0.00")),
+                    default=F("daily_loss_current"),
+                ),
+                daily_loss_reset_date=Case(
+                    When(daily_loss_reset_date__lt=today, then=today),
+                    default=F("daily_loss_reset_date"),
+                ),
+                updated_at=timezone.now(),
             )
+        )
 
-        balance_before = account.balance
-        account.locked_balance += amount
-        account.save()
+        # Our UPDATE holds the row lock until commit, so this read is stable
+        account = Account.objects.get(id=account_id)
+        if not updated:
+            raise WalletService._lock_rejection(account, amount)
+
+        notify_balance_update(sender=Account, instance=account)
 
         txn = Transaction.objects.create(
             account=account,
             transaction_type=TransactionType.TRADE_LOCK.value,
             status=TransactionStatus.COMPLETED.value,
             amount=-amount,
-            balance_before=balance_before,
+            balance_before=account.balance,
             balance_after=account.balance,
             trade_id=trade_id,
             description=description or f"Margin locked for trade {trade_id}",
@@ -54,17 +95,41 @@ class WalletService:
 
         return txn
 
+    @staticmethod
+    def _lock_rejection(account, amount):
+        """Exception explaining why lock_balance matched no row"""
+        if account.status != "active":
+            return AccountSuspendedError(
+                f"Account {account.account_number} is {account.status}"
+            )
+
+        # Daily Loss QA
+        if not WalletService.check_daily_loss_limit(account):
+            return DailyLossLimitExceeded(
+                f"Daily loss limit exceeded. Current: {account.daily_loss_current}, "
+                f"Limit: {account.max_daily_loss}. Balance locking rejected.",
+                details={
+                    "daily_loss_current": str(account.daily_loss_current),
+                    "daily_loss_max": str(account.max_daily_loss),
+                },
+            )
+
+        return InsufficientBalanceError(
+            f"Insufficient balance. Available: {account.available_balance}, Required: {amount}"
+        )
+
     @staticmethod
     @transaction.atomic
     def release_balance(account_id, amount, trade_id, description=""):
         """Release locked balance"""
-        account = Account.objects.select_for_update().get(id=account_id)
+        amount = _to_cents(amount)
+        account = WalletService._lock_account_nowait(account_id)
 
         balance_before = account.balance
         account.locked_balance -= amount
         if account.locked_balance < 0:
             account.locked_balance = Decimal("0.00")
-        account.save()
+        account.save(update_fields=["locked_balance", "updated_at"])
 
         txn = Transaction.objects.create(
             account=account,
@@ -84,7 +149,8 @@ class WalletService:
     @transaction.atomic
     def apply_pnl(account_id, pnl_amount, trade_id, description=""):
         """Apply profit/loss to account"""
-        account = Account.objects.select_for_update().get(id=account_id)
+        pnl_amount = _to_cents(pnl_amount)
+        account = WalletService._lock_account_nowait(account_id)
         wallet = Wallet.objects.select_for_update().get(account=account)
 
         balance_before = account.balance
@@ -96,7 +162,7 @@ class WalletService:
         else:
             wallet.total_profit += pnl_amount
 
-        account.save()
+        account.save(update_fields=["balance", "daily_loss_current", "updated_at"])
         wallet.save()
 
         txn = Transaction.objects.create(
@@ -118,6 +184,28 @@ class WalletService:
 
         return txn
 
+    @staticmethod
+    def _lock_account_nowait(account_id):
+        """
+        SELECT ... FOR UPDATE NOWAIT on the account row.
+
+        A concurrent wallet operation on the same account makes this fail
+        fast with AccountBusyError (surfaced as 409, client retries) instead
+        of queueing on the row lock. Other accounts are never blocked.
+        skip_locked is not used: it would turn a locked row into a
+        misleading DoesNotExist. Any other OperationalError (lost
+        connection, statement timeout) is not retryable and is re-raised.
+        """
+        try:
+            return Account.objects.select_for_update(nowait=True).get(id=account_id)
+        except OperationalError as e:
+            if getattr(e.__cause__, "pgcode", None) != _LOCK_NOT_AVAILABLE:
+                raise
+            raise AccountBusyError(
+                f"Account {account_id} is locked by another operation",
+                details={"account_id": str(account_id)},
+            ) from e
+
     @staticmethod
     def check_daily_loss_limit(account):
         """Check if account exceeded daily loss limit"""
@@ -125,8 +213,6 @@ class WalletService:
             return True
 
         # Reset daily loss if new day
-        from datetime import date
-
         if account.daily_loss_reset_date < date.today():
             account.daily_loss_current = Decimal("0.00")
             account.daily_loss_reset_date = date.today()
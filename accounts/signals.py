@@ -2,11 +2,17 @@
 Django Signals for real-time updates via WebSocket/Signal
 Used for Flutter app real-time PnL updates
 """
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 import logging
 
+from allauth.socialaccount.models import SocialAccount
+
 from .models import Transaction, Account
+from .services.account_service import AccountService
+from .services.profile_service import ProfileService
 from common.enums import TransactionType
 
 logger = logging.getLogger(__name__)
@@ -105,3 +111,44 @@ def notify_balance_update(sender, instance, **kwargs):
                 exc_info=True
             )
 
+
+# Columns cached by AccountService.get_account_for_user
+OWNERSHIP_FIELDS = frozenset({"user", "account_number", "account_type"})
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_ownership_cache(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the cached ownership lookup when the account is deleted or one of
+    its identity columns may have changed. Balance-only saves from the
+    wallet hot path (update_fields) keep the cache warm.
+    """
+    if update_fields is not None and not OWNERSHIP_FIELDS.intersection(update_fields):
+        return
+    cache.delete(AccountService.ownership_cache_key(instance.user_id, instance.id))
+
+
+# Columns (plus the Google social account) rendered by UserDetailSerializer
+PROFILE_FIELDS = frozenset({
+    "email", "first_name", "last_name", "phone", "is_verified",
+    "kyc_status", "compliance_mode",
+})
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_profile_cache(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the cached profile when a profile column may have changed.
+    Saves limited to other columns (e.g. last_login) keep it warm.
+    """
+    if update_fields is not None and not PROFILE_FIELDS.intersection(update_fields):
+        return
+    ProfileService.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=SocialAccount)
+@receiver(post_delete, sender=SocialAccount)
+def invalidate_profile_cache_for_social_account(sender, instance, **kwargs):
+    """google_id and avatar in the profile come from the social account"""
+    ProfileService.invalidate(instance.user_id)
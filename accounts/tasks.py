@@ -0,0 +1,20 @@
+"""
+Celery tasks for the accounts app
+"""
+from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.utils.dateparse import parse_datetime
+
+
+@shared_task(ignore_result=True)
+def touch_last_login(user_id, timestamp):
+    """
+    Persist a user's last login time outside the login request.
+
+    Args:
+        user_id: User primary key
+        timestamp: ISO-8601 login time
+    """
+    get_user_model().objects.filter(pk=user_id).update(
+        last_login=parse_datetime(timestamp)
+    )
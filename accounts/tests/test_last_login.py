@@ -0,0 +1,47 @@
+"""
+Tests for recording the last login time
+"""
+from unittest import mock
+from django.test import TestCase, override_settings
+
+from accounts.api.auth_views import record_last_login
+from accounts.models import User
+
+
+class RecordLastLoginTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="lastlogin",
+            email="lastlogin@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        patcher = mock.patch("accounts.api.auth_views.touch_last_login")
+        self.task = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stored_last_login(self):
+        return User.objects.get(pk=self.user.pk).last_login
+
+    @override_settings(CELERY_BROKER_URL=None)
+    def test_no_broker_writes_directly(self):
+        record_last_login(self.user)
+
+        self.task.apply_async.assert_not_called()
+        self.assertEqual(self._stored_last_login(), self.user.last_login)
+
+    @override_settings(CELERY_BROKER_URL="redis://broker:6379/0")
+    def test_broker_queues_without_retries(self):
+        record_last_login(self.user)
+
+        self.task.apply_async.assert_called_once()
+        self.assertIs(self.task.apply_async.call_args.kwargs["retry"], False)
+        self.assertIsNone(self._stored_last_login())
+
+    @override_settings(CELERY_BROKER_URL="redis://broker:6379/0")
+    def test_unavailable_broker_falls_back(self):
+        self.task.apply_async.side_effect = ConnectionError("broker down")
+
+        record_last_login(self.user)
+
+        self.assertEqual(self._stored_last_login(), self.user.last_login)
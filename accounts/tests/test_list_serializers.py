@@ -0,0 +1,99 @@
+"""
+List serializers must render exactly what the ModelSerializers render
+"""
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User, Account, Transaction, Deposit, Withdrawal
+from accounts.serializers import (
+    DepositSerializer,
+    DepositListSerializer,
+    WithdrawalSerializer,
+    WithdrawalListSerializer,
+)
+from common.enums import AccountType, TransactionType, TransactionStatus
+
+
+class ListSerializerParityTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="lists",
+            email="lists@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_type=AccountType.REAL.value,
+            account_number="REAL-LIST-001",
+            balance=Decimal("5000.00"),
+            status="active",
+        )
+
+    def _transaction(self, transaction_type, amount):
+        return Transaction.objects.create(
+            account=self.account,
+            transaction_type=transaction_type,
+            status=TransactionStatus.PENDING.value,
+            amount=amount,
+            balance_before=self.account.balance,
+            balance_after=self.account.balance,
+        )
+
+    def _assert_same(self, list_serializer, model_serializer, queryset):
+        # Fetched the way the viewsets fetch them (select_related account)
+        for obj in queryset.select_related("account"):
+            self.assertEqual(dict(model_serializer(obj).data), list_serializer(obj).data)
+
+    def test_deposit_output_matches(self):
+        Deposit.objects.create(
+            account=self.account,
+            transaction=self._transaction(TransactionType.DEPOSIT.value, Decimal("100.50")),
+            payment_method="crypto_btc",
+            amount=Decimal("100.50"),
+            crypto_address="bc1qexample",
+        )
+        Deposit.objects.create(
+            account=self.account,
+            transaction=self._transaction(TransactionType.DEPOSIT.value, Decimal("1000")),
+            payment_method="visa",
+            amount=Decimal("1000"),
+            status="completed",
+            gateway_transaction_id="GW-1",
+            completed_at=timezone.now(),
+        )
+
+        self._assert_same(DepositListSerializer, DepositSerializer, Deposit.objects.all())
+
+        # null completed_at and two-place decimals
+        pending = DepositListSerializer(
+            Deposit.objects.select_related("account").get(crypto_address="bc1qexample")
+        ).data
+        self.assertIsNone(pending["completed_at"])
+        self.assertEqual(pending["amount"], "100.50")
+
+    def test_withdrawal_output_matches(self):
+        Withdrawal.objects.create(
+            account=self.account,
+            transaction=self._transaction(TransactionType.WITHDRAW.value, Decimal("-200")),
+            payment_method="crypto_eth",
+            amount=Decimal("200"),
+            fee=Decimal("2.5"),
+            net_amount=Decimal("197.5"),
+            destination_address="0xexample",
+        )
+        Withdrawal.objects.create(
+            account=self.account,
+            transaction=self._transaction(TransactionType.WITHDRAW.value, Decimal("-50")),
+            payment_method="visa",
+            amount=Decimal("50.00"),
+            fee=Decimal("0.00"),
+            net_amount=Decimal("50.00"),
+            destination_address="4111",
+            status="rejected",
+            rejection_reason="KYC",
+            completed_at=timezone.now(),
+        )
+
+        self._assert_same(WithdrawalListSerializer, WithdrawalSerializer, Withdrawal.objects.all())
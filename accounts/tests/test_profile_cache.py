@@ -0,0 +1,55 @@
+"""
+Tests for the profile cache (ProfileService)
+"""
+import tempfile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.services.profile_service import ProfileService
+
+
+class ProfileCacheTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="profile",
+            email="profile@halolbroker.test",
+            password="StrongPassword123!",
+            first_name="Old",
+        )
+        self.client = APIClient()
+
+    def _first_name(self):
+        # Fresh instance per request, as token authentication would load
+        self.client.force_authenticate(user=User.objects.get(pk=self.user.pk))
+        return self.client.get("/api/accounts/auth/profile/").data["first_name"]
+
+    def test_per_process_cache_is_not_used(self):
+        """LocMemCache is per worker, so the profile is always rebuilt"""
+        self.assertFalse(ProfileService.cache_enabled())
+        self.assertEqual(self._first_name(), "Old")
+
+        # No signal: a cached entry would still say "Old"
+        User.objects.filter(pk=self.user.pk).update(first_name="New")
+        self.assertEqual(self._first_name(), "New")
+
+    def test_shared_cache_is_used_and_invalidated(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            backend = {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir,
+                }
+            }
+            with override_settings(CACHES=backend):
+                self.assertTrue(ProfileService.cache_enabled())
+                self.assertEqual(self._first_name(), "Old")
+
+                User.objects.filter(pk=self.user.pk).update(first_name="New")
+                self.assertEqual(self._first_name(), "Old")
+
+                # A model save goes through the post_save invalidation
+                self.user.first_name = "Saved"
+                self.user.save()
+                self.assertEqual(self._first_name(), "Saved")
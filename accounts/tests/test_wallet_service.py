@@ -0,0 +1,238 @@
+"""
+Tests for WalletService margin locking and row-lock contention
+"""
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+from django.db import OperationalError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User, Account, Wallet, Transaction
+from accounts.services.account_service import AccountService
+from accounts.services.wallet_service import WalletService
+from common.enums import AccountType, TransactionType
+from common.exceptions import (
+    AccountBusyError,
+    AccountSuspendedError,
+    DailyLossLimitExceeded,
+    InsufficientBalanceError,
+)
+
+
+class LockBalanceTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="wallet",
+            email="wallet@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_type=AccountType.REAL.value,
+            account_number="REAL-LOCK-001",
+            balance=Decimal("1000.00"),
+            locked_balance=Decimal("200.00"),
+            max_daily_loss=Decimal("100.00"),
+            status="active",
+        )
+        Wallet.objects.create(account=self.account)
+
+        patcher = mock.patch("accounts.services.wallet_service.notify_balance_update")
+        self.notify = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lock_success(self):
+        txn = WalletService.lock_balance(self.account.id, Decimal("300.00"), uuid.uuid4())
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.locked_balance, Decimal("500.00"))
+        self.assertEqual(txn.transaction_type, TransactionType.TRADE_LOCK.value)
+        self.assertEqual(txn.amount, Decimal("-300.00"))
+        self.assertEqual(txn.balance_before, Decimal("1000.00"))
+        self.notify.assert_called_once()
+        self.assertEqual(self.notify.call_args.kwargs["instance"].locked_balance, Decimal("500.00"))
+
+    def test_amount_is_rounded_to_cents(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        response = client.post(
+            "/api/accounts/wallet/lock/",
+            {
+                "account_id": str(self.account.id),
+                "amount": "110.0375",
+                "trade_id": str(uuid.uuid4()),
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.locked_balance, Decimal("310.04"))
+        self.assertEqual(Transaction.objects.get().amount, Decimal("-110.04"))
+
+    def test_insufficient_balance(self):
+        # 200 already locked, 801 more would exceed the 1000 balance
+        with self.assertRaises(InsufficientBalanceError):
+            WalletService.lock_balance(self.account.id, Decimal("801.00"), uuid.uuid4())
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.locked_balance, Decimal("200.00"))
+        self.assertFalse(Transaction.objects.exists())
+        self.notify.assert_not_called()
+
+    def test_suspended_account(self):
+        Account.objects.filter(pk=self.account.pk).update(status="suspended")
+
+        with self.assertRaises(AccountSuspendedError):
+            WalletService.lock_balance(self.account.id, Decimal("10.00"), uuid.uuid4())
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.locked_balance, Decimal("200.00"))
+        self.notify.assert_not_called()
+
+    def test_daily_loss_exceeded(self):
+        Account.objects.filter(pk=self.account.pk).update(daily_loss_current=Decimal("100.00"))
+
+        with self.assertRaises(DailyLossLimitExceeded):
+            WalletService.lock_balance(self.account.id, Decimal("10.00"), uuid.uuid4())
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.locked_balance, Decimal("200.00"))
+        self.notify.assert_not_called()
+
+    def test_stale_daily_loss_is_reset(self):
+        yesterday = date.today() - timedelta(days=1)
+        Account.objects.filter(pk=self.account.pk).update(
+            daily_loss_current=Decimal("100.00"),
+            daily_loss_reset_date=yesterday,
+        )
+
+        WalletService.lock_balance(self.account.id, Decimal("10.00"), uuid.uuid4())
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.daily_loss_current, Decimal("0.00"))
+        self.assertEqual(self.account.daily_loss_reset_date, date.today())
+        self.assertEqual(self.account.locked_balance, Decimal("210.00"))
+
+
+class _PgError(Exception):
+    """Stand-in for the driver error Django wraps in OperationalError"""
+
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+
+def _operational_error(pgcode):
+    error = OperationalError("database error")
+    error.__cause__ = _PgError(pgcode)
+    return error
+
+
+class LockNowaitTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="nowait",
+            email="nowait@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_type=AccountType.REAL.value,
+            account_number="REAL-NOWAIT-001",
+            balance=Decimal("1000.00"),
+            locked_balance=Decimal("100.00"),
+            status="active",
+        )
+
+    def _select_for_update_raising(self, pgcode):
+        queryset = mock.Mock()
+        queryset.get.side_effect = _operational_error(pgcode)
+        return mock.patch.object(
+            Account.objects, "select_for_update", return_value=queryset
+        )
+
+    def test_lock_not_available_is_account_busy(self):
+        with self._select_for_update_raising("55P03"):
+            with self.assertRaises(AccountBusyError):
+                WalletService.release_balance(self.account.id, Decimal("10.00"), uuid.uuid4())
+
+    def test_other_operational_errors_propagate(self):
+        # 57014: query_canceled (statement timeout)
+        with self._select_for_update_raising("57014"):
+            with self.assertRaises(OperationalError):
+                WalletService.release_balance(self.account.id, Decimal("10.00"), uuid.uuid4())
+
+    def test_release_view_returns_409(self):
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        with self._select_for_update_raising("55P03"):
+            response = client.post(
+                "/api/accounts/wallet/release/",
+                {
+                    "account_id": str(self.account.id),
+                    "amount": "10.00",
+                    "trade_id": str(uuid.uuid4()),
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["code"], "ACCOUNT_BUSY")
+
+
+class AccountOwnershipTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="owner",
+            email="owner@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            email="other@halolbroker.test",
+            password="StrongPassword123!",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_type=AccountType.REAL.value,
+            account_number="REAL-OWNER-001",
+            balance=Decimal("1000.00"),
+            status="active",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _lock(self):
+        return self.client.post(
+            "/api/accounts/wallet/lock/",
+            {
+                "account_id": str(self.account.id),
+                "amount": "10.00",
+                "trade_id": str(uuid.uuid4()),
+            },
+            format="json",
+        )
+
+    def test_per_process_cache_is_not_used(self):
+        """A moved account fails the check at once, without a signal"""
+        AccountService.get_account_for_user(self.user.id, self.account.id)
+        Account.objects.filter(pk=self.account.pk).update(user=self.other)
+
+        with self.assertRaises(Account.DoesNotExist):
+            AccountService.get_account_for_user(self.user.id, self.account.id)
+        self.assertEqual(self._lock().status_code, 404)
+
+    def test_account_deleted_after_check_is_404(self):
+        with mock.patch.object(AccountService, "get_account_for_user"):
+            Account.objects.filter(pk=self.account.pk).delete()
+            response = self._lock()
+
+        self.assertEqual(response.status_code, 404)
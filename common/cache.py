@@ -0,0 +1,17 @@
+"""
+Cache backend helpers
+"""
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_shared_cache(alias: str = "default") -> bool:
+    """
+    True if the cache is shared between worker processes.
+
+    Per-process backends (LocMemCache, the default when CACHES is not
+    set) cannot be invalidated across workers, so data that must not be
+    served stale is only cached when this returns True.
+    """
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
@@ -127,3 +127,10 @@ class RiskLimitError(TradingPlatformException):
     def __init__(self, message="Risk limit exceeded", details=None):
         super().__init__(message=message, code="RISK_LIMIT_ERROR", details=details)
 
+
+
+class AccountBusyError(TradingPlatformException):
+    """Raised when the account row is locked by a concurrent wallet operation"""
+
+    def __init__(self, message="Account is busy, retry the request", details=None):
+        super().__init__(message=message, code="ACCOUNT_BUSY", details=details)
@@ -0,0 +1,50 @@
+"""
+orjson-backed JSON renderer for DRF
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder formats what orjson does not take natively (Decimal,
+# lazy strings, querysets) and keeps datetimes in DRF's format
+_drf_default = JSONEncoder().default
+
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+# Valid in JSON but not in JavaScript string literals; DRF escapes them
+_JS_SEPARATORS = (
+    ("\u2028".encode(), b"\\u2028"),
+    ("\u2029".encode(), b"\\u2029"),
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for JSONRenderer using orjson for encoding.
+    Output matches JSONRenderer's compact form, except:
+    - NaN and +/-Infinity render as null (JSONRenderer raises ValueError)
+    - indented output (browsable API, ?indent=) uses orjson's fixed
+      two-space indent
+    Integers beyond 64 bits, which orjson rejects, are rendered by
+    JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = _OPTIONS
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for separator, escaped in _JS_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+        return ret
@@ -0,0 +1,54 @@
+"""
+Tests for the orjson renderer
+"""
+import uuid
+from decimal import Decimal
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """ORJSONRenderer must produce the same bytes as DRF's JSONRenderer
+    (non-finite floats aside, see test_non_finite_floats_render_null)"""
+
+    def test_matches_json_renderer(self):
+        data = {
+            "id": uuid.uuid4(),
+            "amount": Decimal("100.50"),
+            "created_at": timezone.now(),
+            "date": timezone.now().date(),
+            "note": "Sharia-compliant ✓",
+            "items": [1, 2.5, None, True],
+            1: "non-string key",
+        }
+
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            JSONRenderer().render(data),
+        )
+
+    def test_line_separators_are_escaped(self):
+        data = {"note": "line\u2028para\u2029end"}
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(rendered, JSONRenderer().render(data))
+        self.assertIn(b"\\u2028", rendered)
+
+    def test_big_integers_fall_back(self):
+        data = {"value": 2 ** 70, "negative": -(2 ** 64)}
+
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            JSONRenderer().render(data),
+        )
+
+    def test_non_finite_floats_render_null(self):
+        data = [float("nan"), float("inf"), float("-inf")]
+
+        self.assertEqual(ORJSONRenderer().render(data), b"[null,null,null]")
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
@@ -7,11 +7,52 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.db.models import Count, OuterRef, Prefetch, Subquery
 from django.utils import timezone
 from datetime import timedelta
 
 from trading.models import Position, PositionLog
-from trading.serializers import PositionSerializer, PositionLogSerializer
+from trading.serializers import (
+    PositionSerializer,
+    PositionListSerializer,
+    PositionLogSerializer,
+)
+
+# Columns read by PositionSerializer / PositionLogSerializer. Loading only
+# these keeps the row width down (no hedge flags, no unused joins).
+POSITION_FIELDS = (
+    "id",
+    "account",
+    "instrument",
+    "instrument__symbol",
+    "instrument__is_halal",
+    "instrument__is_crypto",
+    "instrument__min_stop_distance",
+    "side",
+    "mode",
+    "entry_price",
+    "stop_loss",
+    "take_profit",
+    "risk_percent",
+    "position_size",
+    "remaining_size",
+    "status",
+    "opened_at",
+    "closed_at",
+    "pnl",
+    "unrealized_pnl",
+    "timeframe",
+)
+POSITION_LOG_FIELDS = (
+    "id",
+    "position",
+    "event_type",
+    "price",
+    "size",
+    "pnl",
+    "metadata",
+    "created_at",
+)
 
 
 class TradeHistoryAPIView(APIView):
@@ -59,6 +100,13 @@ class TradeHistoryAPIView(APIView):
                 "description": "Offset for pagination",
                 "schema": {"type": "integer", "default": 0},
             },
+            {
+                "name": "include_logs",
+                "required": False,
+                "in": "query",
+                "description": "Nest full event logs (default: true). False returns log_count and last_event instead",
+                "schema": {"type": "boolean", "default": True},
+            },
         ],
         responses={
             200: OpenApiResponse(
@@ -85,10 +133,32 @@ class TradeHistoryAPIView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Build queryset
+        # Build queryset: instrument is joined, account is serialized as its
+        # id only
         queryset = Position.objects.filter(
             account__user=request.user
-        ).select_related("instrument", "account").prefetch_related("logs").order_by("-opened_at")
+        ).select_related("instrument").only(*POSITION_FIELDS).order_by("-opened_at")
+
+        include_logs = request.query_params.get("include_logs", "true").lower() not in ("false", "0")
+        if include_logs:
+            # Logs for the whole page in one extra query
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "logs",
+                    queryset=PositionLog.objects.only(*POSITION_LOG_FIELDS).order_by("-created_at"),
+                )
+            )
+            serializer_class = PositionSerializer
+        else:
+            # Summary only: no PositionLog rows are hydrated
+            latest_event = PositionLog.objects.filter(
+                position=OuterRef("pk")
+            ).order_by("-created_at").values("event_type")[:1]
+            queryset = queryset.annotate(
+                log_count=Count("logs"),
+                last_event=Subquery(latest_event),
+            )
+            serializer_class = PositionListSerializer
         
         # Apply filters
         account_id = request.query_params.get("account_id")
@@ -118,7 +188,7 @@ class TradeHistoryAPIView(APIView):
         positions = queryset[offset:offset + limit]
         
         # Serialize
-        serializer = PositionSerializer(positions, many=True)
+        serializer = serializer_class(positions, many=True)
         
         return Response({
             "count": total_count,
@@ -185,17 +255,18 @@ class TradeEventsAPIView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Build queryset
+        # Build queryset: PositionLogSerializer reads no position data, so
+        # nothing is joined for output
         queryset = PositionLog.objects.filter(
-            position__account__user=request.user
-        ).select_related("position", "position__instrument", "position__account").order_by("-created_at")
+            account__user=request.user
+        ).only(*POSITION_LOG_FIELDS).order_by("-created_at")
         
         # Filter by account
         account_id = request.query_params.get("account_id")
         if account_id:
             try:
                 account_id = int(account_id)
-                queryset = queryset.filter(position__account_id=account_id)
+                queryset = queryset.filter(account_id=account_id)
             except ValueError:
                 return Response(
                     {"error": "Invalid account_id"},
@@ -5,8 +5,9 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
-from trading.models import TradeAccount, Instrument, Position
+from trading.models import TradeAccount, Position
 from trading.services.trade_open import open_trade
+from trading.services.instruments import get_instrument_by_symbol
 from trading.serializers import (
     TradeOpenRequestSerializer,
     TradeOpenResponseSerializer,
@@ -78,14 +79,8 @@ class TradeOpenAPIView(APIView):
             risk_percent = float(serializer.validated_data.get("risk_percent"))
             timeframe = serializer.validated_data.get("timeframe")
             
-            # Get or create instrument
-            instrument, created = Instrument.objects.get_or_create(
-                symbol=symbol,
-                defaults={
-                    "is_halal": True,
-                    "is_crypto": any(c in symbol for c in ["BTC", "ETH", "USDT", "USDC"]),
-                }
-            )
+            # Get or create instrument (cached by symbol)
+            instrument = get_instrument_by_symbol(symbol)
             
             # Convert take_profit if provided
             if take_profit is not None:
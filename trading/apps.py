@@ -1,5 +1,13 @@
-# from django.apps import AppConfig
+from django.apps import AppConfig
 
 
-# class TradingConfig(AppConfig):
-#     name = 'trading'
+class TradingConfig(AppConfig):
+    name = 'trading'
+    _signals_loaded = False
+
+    def ready(self):
+        """Import signals once at startup (ready() can run more than once)"""
+        if self._signals_loaded:
+            return
+        import trading.signals  # noqa
+        self._signals_loaded = True
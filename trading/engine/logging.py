@@ -2,13 +2,66 @@
 Trade History Logging Engine
 Logs all trade lifecycle events (OPEN, CLOSE, SL_HIT, TP_HIT, PARTIAL).
 """
+from collections import deque
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from django.utils import timezone
 from trading.models import Position, PositionLog
 from common.enums import TradeEvent
 
 
+class PositionLogBuffer:
+    """
+    Collects PositionLog rows and writes them with bulk_create.
+
+    Rows are flushed once batch_size are pending, and on leaving the
+    ``with`` block. Use it inside the transaction that produces the
+    events: nothing is written if the block raises.
+
+    Not thread-safe: a buffer belongs to the thread (and DB connection)
+    whose transaction it flushes into.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self._pending = deque()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def append(self, **fields) -> PositionLog:
+        """Queue one (unsaved) PositionLog built from model field values"""
+        # bulk_create skips PositionLog.save(), which normally copies the
+        # account from the position
+        if "account" not in fields and fields.get("account_id") is None:
+            position = fields.get("position")
+            if position is not None:
+                fields["account_id"] = position.account_id
+        log = PositionLog(**fields)
+        self._pending.append(log)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return log
+
+    def flush(self) -> List[PositionLog]:
+        """Insert all pending rows"""
+        batch = list(self._pending)
+        self._pending.clear()
+        if not batch:
+            return batch
+        return PositionLog.objects.bulk_create(batch, batch_size=self.batch_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending.clear()
+        return False
+
+
 class TradeLogger:
     """Trade event logging engine"""
     
@@ -19,7 +72,8 @@ class TradeLogger:
         price: Optional[Decimal] = None,
         size: Optional[Decimal] = None,
         pnl: Optional[Decimal] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        buffer: Optional[PositionLogBuffer] = None
     ) -> PositionLog:
         """
         Log a trade event.
@@ -31,19 +85,23 @@ class TradeLogger:
             size: Size affected (for partial close)
             pnl: PnL at this event
             metadata: Additional event data
+            buffer: Queue the row on this buffer instead of inserting it now
         
         Returns:
-            PositionLog instance
+            PositionLog instance (unsaved until the buffer flushes)
         """
-        log = PositionLog.objects.create(
+        fields = dict(
             position=position,
+            account_id=position.account_id,
             event_type=event_type,
             price=price,
             size=size,
             pnl=pnl,
             metadata=metadata or {}
         )
-        return log
+        if buffer is not None:
+            return buffer.append(**fields)
+        return PositionLog.objects.create(**fields)
     
     @staticmethod
     def log_open(position: Position, entry_price: Decimal) -> PositionLog:
@@ -19,7 +19,7 @@ def _build_base_payload(position: Position, account: TradeAccount) -> Dict[str,
     return {
         "position_id": str(position.id),
         "account_id": str(account.id),
-        "user_id": account.user.id if account.user else None,
+        "user_id": account.user_id,
         "symbol": position.instrument.symbol,
         "side": position.side,
         "mode": position.mode,
@@ -61,7 +61,7 @@ def on_trade_open(position: Position, account: TradeAccount, entry_price: Decima
     notify(
         event_type="TRADE_OPENED",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
@@ -106,7 +106,7 @@ def on_trade_close(
     notify(
         event_type="TRADE_CLOSED",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
@@ -147,7 +147,7 @@ def on_sl_hit(
     notify(
         event_type="SL_HIT",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
@@ -188,7 +188,7 @@ def on_tp_hit(
     notify(
         event_type="TP_HIT",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
@@ -231,7 +231,7 @@ def on_pnl_update(
     notify(
         event_type="PNL_UPDATE",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
@@ -270,7 +270,7 @@ def on_calm_mode_feedback(
     notify(
         event_type="CALM_MODE_FEEDBACK",
         payload=payload,
-        user_id=account.user.id if account.user else None
+        user_id=account.user_id
     )
     
     return payload
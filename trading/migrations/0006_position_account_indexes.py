@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Composite indexes for hot Position lookups.
+
+    Written as RunSQL because the merged migration state (0002_remove_...
+    + 0004) no longer tracks Position, so AddIndex cannot target it.
+    """
+
+    dependencies = [
+        ('trading', '0005_merge_20260128_0629'),
+    ]
+
+    operations = [
+        # Demo reset, open-positions listing: filter(account=..., status__in=...)
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS pos_acct_status_idx "
+                "ON trading_position (account_id, status);",
+            reverse_sql="DROP INDEX IF EXISTS pos_acct_status_idx;",
+        ),
+        # Hedge-free check: open/partial position on the same account and
+        # instrument. Partial, so closed history does not bloat it.
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS pos_open_idx "
+                "ON trading_position (account_id, instrument_id) "
+                "WHERE status IN ('OPEN', 'PARTIAL');",
+            reverse_sql="DROP INDEX IF EXISTS pos_open_idx;",
+        ),
+    ]
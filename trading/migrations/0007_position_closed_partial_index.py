@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Partial index for per-account daily realized PnL (closed positions only).
+    RunSQL for the same reason as 0006 (Position is missing from the state).
+    """
+
+    dependencies = [
+        ('trading', '0006_position_account_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS pos_closed_idx "
+                "ON trading_position (account_id, closed_at) "
+                "WHERE status = 'CLOSED';",
+            reverse_sql="DROP INDEX IF EXISTS pos_closed_idx;",
+        ),
+    ]
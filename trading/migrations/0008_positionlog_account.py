@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Denormalized PositionLog.account, backfilled from the position, with an
+    index for per-account event queries.
+    RunSQL for the same reason as 0006 (TradeAccount and Position are
+    missing from the state).
+    """
+
+    dependencies = [
+        ('trading', '0007_position_closed_partial_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="ALTER TABLE trading_positionlog "
+                "ADD COLUMN IF NOT EXISTS account_id bigint NULL "
+                "REFERENCES trading_tradeaccount (id) DEFERRABLE INITIALLY DEFERRED;",
+            reverse_sql="ALTER TABLE trading_positionlog DROP COLUMN IF EXISTS account_id;",
+        ),
+        migrations.RunSQL(
+            sql="UPDATE trading_positionlog SET account_id = ("
+                "SELECT account_id FROM trading_position "
+                "WHERE trading_position.id = trading_positionlog.position_id"
+                ") WHERE account_id IS NULL;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        # Events feed / reports: account + event type + time range
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS poslog_acct_event_idx "
+                "ON trading_positionlog (account_id, event_type, created_at);",
+            reverse_sql="DROP INDEX IF EXISTS poslog_acct_event_idx;",
+        ),
+    ]
@@ -118,6 +118,15 @@ class PositionLog(models.Model):
     position = models.ForeignKey(
         Position, on_delete=models.CASCADE, related_name="logs"
     )
+    # Copy of position.account so per-account event queries skip the
+    # Position join. Indexed via poslog_acct_event_idx (migration 0008).
+    account = models.ForeignKey(
+        TradeAccount,
+        on_delete=models.CASCADE,
+        related_name="position_logs",
+        null=True,
+        db_index=False,
+    )
     event_type = models.CharField(
         max_length=20,
         choices=TradeEvent.choices()
@@ -134,7 +143,9 @@ class PositionLog(models.Model):
         max_digits=20, decimal_places=2, null=True, blank=True
     )  # PnL at this event
     
-    # Metadata
+    # Metadata (jsonb on PostgreSQL). Nothing filters on its keys, so it
+    # has no GIN index; add one (jsonb_path_ops) together with the first
+    # metadata__ lookup rather than paying the write cost up front.
     metadata = models.JSONField(default=dict, blank=True)  # Additional event data
     created_at = models.DateTimeField(auto_now_add=True)
     
@@ -146,5 +157,10 @@ class PositionLog(models.Model):
             models.Index(fields=["event_type"]),
         ]
     
+    def save(self, *args, **kwargs):
+        if self.account_id is None and self.position_id is not None:
+            self.account_id = self.position.account_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.position.instrument.symbol} {self.event_type} @ {self.created_at}"
@@ -7,6 +7,26 @@ from decimal import Decimal
 from trading.models import Position, PositionLog, TradeAccount, Instrument
 from common.enums import TradeEvent
 
+# Choice labels resolved once instead of per row via get_*_display
+_STATUS_LABELS = dict(Position.Status.choices)
+_SIDE_LABELS = dict(Position.Side.choices)
+_MODE_LABELS = dict(Position.Mode.choices)
+
+# Direction sign and error messages per side: stop loss must sit on the
+# losing side of entry, take profit on the winning side
+_SIDE_RULES = {
+    Position.Side.BUY: (
+        1,
+        'For BUY, stop loss must be below entry price',
+        'For BUY, take profit must be above entry price',
+    ),
+    Position.Side.SELL: (
+        -1,
+        'For SELL, stop loss must be above entry price',
+        'For SELL, take profit must be below entry price',
+    ),
+}
+
 
 class InstrumentSerializer(serializers.ModelSerializer):
     """Instrument serializer"""
@@ -41,9 +61,9 @@ class PositionSerializer(serializers.ModelSerializer):
     
     instrument = InstrumentSerializer(read_only=True)
     instrument_symbol = serializers.CharField(write_only=True, required=False)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    side_display = serializers.CharField(source='get_side_display', read_only=True)
-    mode_display = serializers.CharField(source='get_mode_display', read_only=True)
+    status_display = serializers.SerializerMethodField()
+    side_display = serializers.SerializerMethodField()
+    mode_display = serializers.SerializerMethodField()
     logs = PositionLogSerializer(many=True, read_only=True)
     
     class Meta:
@@ -81,6 +101,32 @@ class PositionSerializer(serializers.ModelSerializer):
             'status',
         ]
 
+    def get_status_display(self, obj) -> str:
+        return _STATUS_LABELS.get(obj.status, obj.status)
+
+    def get_side_display(self, obj) -> str:
+        return _SIDE_LABELS.get(obj.side, obj.side)
+
+    def get_mode_display(self, obj) -> str:
+        return _MODE_LABELS.get(obj.mode, obj.mode)
+
+
+class PositionListSerializer(PositionSerializer):
+    """
+    Position serializer for list responses without nested logs.
+    Expects the queryset to be annotated with log_count and last_event
+    (see TradeHistoryAPIView).
+    """
+
+    logs = None
+    log_count = serializers.IntegerField(read_only=True)
+    last_event = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta(PositionSerializer.Meta):
+        fields = [
+            field for field in PositionSerializer.Meta.fields if field != 'logs'
+        ] + ['log_count', 'last_event']
+
 
 class TradeOpenRequestSerializer(serializers.Serializer):
     """Trade open request serializer"""
@@ -139,26 +185,15 @@ class TradeOpenRequestSerializer(serializers.Serializer):
         take_profit = attrs.get('take_profit')
         side = attrs.get('side')
         
+        sign, stop_loss_error, take_profit_error = _SIDE_RULES[side]
+
         # Validate stop loss direction
-        if side == Position.Side.BUY and stop_loss >= entry_price:
-            raise serializers.ValidationError({
-                'stop_loss': 'For BUY, stop loss must be below entry price'
-            })
-        if side == Position.Side.SELL and stop_loss <= entry_price:
-            raise serializers.ValidationError({
-                'stop_loss': 'For SELL, stop loss must be above entry price'
-            })
+        if (entry_price - stop_loss) * sign <= 0:
+            raise serializers.ValidationError({'stop_loss': stop_loss_error})
         
         # Validate take profit if provided
-        if take_profit is not None:
-            if side == Position.Side.BUY and take_profit <= entry_price:
-                raise serializers.ValidationError({
-                    'take_profit': 'For BUY, take profit must be above entry price'
-                })
-            if side == Position.Side.SELL and take_profit >= entry_price:
-                raise serializers.ValidationError({
-                    'take_profit': 'For SELL, take profit must be below entry price'
-                })
+        if take_profit is not None and (take_profit - entry_price) * sign <= 0:
+            raise serializers.ValidationError({'take_profit': take_profit_error})
         
         return attrs
 
@@ -5,11 +5,25 @@ from decimal import Decimal
 from django.db import transaction
 from django.utils import timezone
 
+from common.enums import TradeEvent
 from common.exceptions import SecurityException, TradeValidationError
+from trading.engine.logging import PositionLogBuffer
 from trading.models import Position, TradeAccount
 
 
 DEFAULT_DEMO_BALANCE = Decimal("10000.00")
+_ACTIVE_STATUSES = frozenset((Position.Status.OPEN, Position.Status.PARTIAL))
+_CLOSE_BATCH_SIZE = 1000
+
+
+def _close_positions(position_ids, closed_at):
+    """Mark locked positions closed by id"""
+    if position_ids:
+        Position.objects.filter(pk__in=position_ids).update(
+            status=Position.Status.CLOSED,
+            closed_at=closed_at,
+            remaining_size=Decimal("0"),
+        )
 
 
 @transaction.atomic
@@ -25,12 +39,33 @@ def reset_demo_account(account: TradeAccount, default_balance: Decimal = DEFAULT
 
     # Close positions logically (no PnL application to real wallet)
     now = timezone.now()
-    Position.objects.filter(account=account, status__in=[Position.Status.OPEN, Position.Status.PARTIAL]).update(
-        status=Position.Status.CLOSED,
-        closed_at=now,
-        remaining_size=Decimal("0"),
+    # Rows are locked as they are read: close_trade cannot close one between
+    # its CLOSE log and the update, and only the ids read here are updated,
+    # so a position opened meanwhile is neither closed nor logged.
+    active = Position.objects.select_for_update().filter(
+        account=account, status__in=_ACTIVE_STATUSES
     )
 
+    # One CLOSE event per closed position, inserted in batches. Positions
+    # are streamed as tuples so memory stays bounded on large accounts.
+    with PositionLogBuffer(batch_size=_CLOSE_BATCH_SIZE) as buffer:
+        position_ids = []
+        for position_id, position_size, remaining_size in active.values_list(
+            "id", "position_size", "remaining_size"
+        ).iterator(chunk_size=2000):
+            buffer.append(
+                position_id=position_id,
+                account_id=account.id,
+                event_type=TradeEvent.CLOSE,
+                size=remaining_size if remaining_size is not None else position_size,
+                metadata={"reason": "demo_reset"},
+            )
+            position_ids.append(position_id)
+            if len(position_ids) >= _CLOSE_BATCH_SIZE:
+                _close_positions(position_ids, now)
+                position_ids = []
+        _close_positions(position_ids, now)
+
     account.balance = default_balance
     account.equity = default_balance
     account.save(update_fields=["balance", "equity"])
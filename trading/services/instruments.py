@@ -0,0 +1,43 @@
+"""
+Instrument lookup by symbol, cached (instruments are near-static).
+"""
+from django.core.cache import cache
+
+from common.cache import is_shared_cache
+from trading.models import Instrument
+
+INSTRUMENT_CACHE_PREFIX = "instrument"
+INSTRUMENT_CACHE_TTL = 300  # seconds
+
+CRYPTO_MARKERS = ("BTC", "ETH", "USDT", "USDC")
+
+
+def instrument_cache_key(symbol: str) -> str:
+    return f"{INSTRUMENT_CACHE_PREFIX}:{symbol}"
+
+
+def get_instrument_by_symbol(symbol: str) -> Instrument:
+    """
+    Resolve an instrument by (upper-case) symbol, creating it on first use.
+
+    is_halal gates order entry, so the lookup is only cached on a shared
+    backend, where the trading.signals receivers drop the entry for every
+    worker on save or delete. With a per-process cache it always reads
+    the row.
+    """
+    shared = is_shared_cache()
+    key = instrument_cache_key(symbol)
+    instrument = cache.get(key) if shared else None
+    if instrument is None:
+        instrument, _ = Instrument.objects.only(
+            "id", "symbol", "is_halal", "is_crypto", "min_stop_distance"
+        ).get_or_create(
+            symbol=symbol,
+            defaults={
+                "is_halal": True,
+                "is_crypto": any(marker in symbol for marker in CRYPTO_MARKERS),
+            },
+        )
+        if shared:
+            cache.set(key, instrument, timeout=INSTRUMENT_CACHE_TTL)
+    return instrument
@@ -54,20 +54,23 @@ class PnLSyncService:
         Raises TradeValidationError on mismatch.
         """
         backend_pnl = self.backend_client.apply_pnl(
-            account_ref=position.account.id,
+            account_ref=position.account_id,
             pnl_amount=realized_pnl,
             trade_id=position.id,
         )
 
-        backend_pnl = Decimal(str(backend_pnl))
-        realized_pnl = Decimal(str(realized_pnl))
+        # Both are normally Decimals already; only coerce other types
+        if not isinstance(backend_pnl, Decimal):
+            backend_pnl = Decimal(str(backend_pnl))
+        if not isinstance(realized_pnl, Decimal):
+            realized_pnl = Decimal(str(realized_pnl))
 
         if backend_pnl != realized_pnl:
             raise TradeValidationError(
                 f"PnL mismatch between trading ({realized_pnl}) and backend-2 ({backend_pnl})",
                 details={
                     "position_id": position.id,
-                    "account_id": position.account.id,
+                    "account_id": position.account_id,
                     "backend_pnl": str(backend_pnl),
                     "trading_pnl": str(realized_pnl),
                 },
@@ -1,6 +1,32 @@
 from decimal import Decimal
 from common.constants import RiskLimits
 
+# Optional: only needed for batch sizing (backtests / simulations)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Below this size thread start-up outweighs the fused loop
+NUMBA_MIN_BATCH = 10_000
+
+if np is not None and njit is not None:
+    @njit(parallel=True, cache=True)
+    def _size_kernel(balances, risk_percents, entry_prices, stop_losses, out):
+        for i in prange(balances.size):
+            stop_distance = abs(entry_prices[i] - stop_losses[i])
+            if stop_distance > 0:
+                out[i] = (balances[i] * risk_percents[i] / 100.0) / stop_distance
+            else:
+                out[i] = np.nan
+else:
+    _size_kernel = None
+
 
 def calculate_position_size(balance, risk_percent, entry_price, stop_loss):
     """
@@ -18,24 +44,67 @@ def calculate_position_size(balance, risk_percent, entry_price, stop_loss):
     return position_size.quantize(Decimal("0.0001"))
 
 
+def calculate_position_size_batch(balances, risk_percents, entry_prices, stop_losses):
+    """
+    Vectorized calculate_position_size for backtests and simulations.
+
+    Takes equal-length arrays (scalars are broadcast) and returns float64
+    sizes rounded to 4 decimals; NaN where the stop distance is zero.
+    Float64 math can differ from the Decimal result in the last digit, so
+    live order sizing must keep using calculate_position_size.
+
+    Requires NumPy. Large batches (NUMBA_MIN_BATCH+) run through a
+    parallel Numba kernel when Numba is installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for batch position sizing")
+
+    # Broadcast up front (scalars repeat, mismatched lengths raise
+    # ValueError): the Numba kernel indexes all four arrays unchecked
+    balances, risk_percents, entry_prices, stop_losses = np.broadcast_arrays(
+        np.asarray(balances, dtype=np.float64),
+        np.asarray(risk_percents, dtype=np.float64),
+        np.asarray(entry_prices, dtype=np.float64),
+        np.asarray(stop_losses, dtype=np.float64),
+    )
+
+    if _size_kernel is not None and balances.size >= NUMBA_MIN_BATCH:
+        sizes = np.empty(balances.size, dtype=np.float64)
+        _size_kernel(
+            np.ascontiguousarray(balances).ravel(),
+            np.ascontiguousarray(risk_percents).ravel(),
+            np.ascontiguousarray(entry_prices).ravel(),
+            np.ascontiguousarray(stop_losses).ravel(),
+            sizes,
+        )
+        sizes = sizes.reshape(balances.shape)
+    else:
+        stop_distance = np.abs(entry_prices - stop_losses)
+        risk_amount = balances * risk_percents / 100.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sizes = np.where(stop_distance > 0, risk_amount / stop_distance, np.nan)
+    return np.round(sizes, 4)
+
+
+# Instrument type -> max leverage, resolved once (forex is capped at 1:500)
+_LEVERAGE_LIMITS = {
+    True: ("crypto", RiskLimits.MAX_LEVERAGE["crypto"]),
+    False: ("forex", RiskLimits.MAX_LEVERAGE["forex"]),
+}
+
+
 def validate_leverage(account, instrument):
     """
     Validate leverage against max limits (1:500 for forex).
     """
-    # Get max leverage for instrument type
-    instrument_type = "crypto" if instrument.is_crypto else "forex"
-    max_leverage = RiskLimits.MAX_LEVERAGE.get(instrument_type, RiskLimits.MAX_LEVERAGE["default"])
-    
-    # Check account leverage
+    instrument_type, max_leverage = _LEVERAGE_LIMITS[bool(instrument.is_crypto)]
+
+    # TradeAccount has no max_leverage column; other account types may
     account_leverage = getattr(account, 'max_leverage', None) or max_leverage
-    
+
     if account_leverage > max_leverage:
         raise ValueError(
             f"Leverage {account_leverage}:1 exceeds maximum {max_leverage}:1 for {instrument_type}"
         )
-    
-    # Forex max is 1:500
-    if instrument_type == "forex" and account_leverage > 500:
-        raise ValueError("Forex leverage cannot exceed 1:500")
-    
+
     return True
@@ -2,10 +2,27 @@
 Risk enforcement service aligning Backend-1 with Backend-2 limits (mocked).
 Checks: daily max loss, per-trade risk %, leverage (delegated elsewhere), mode impact.
 """
+from collections import defaultdict
+from datetime import datetime, time
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
 from common.exceptions import RiskLimitError
+from trading.models import Position
+
+
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal("100")
+
+
+@lru_cache(maxsize=256)
+def _float_to_decimal(value: float) -> Decimal:
+    """TradeAccount limits are FloatFields; convert each distinct value once"""
+    return Decimal(str(value))
 
 
 class LimitServiceClientInterface:
@@ -19,13 +36,49 @@ class MockLimitServiceClient(LimitServiceClientInterface):
     """In-memory mock limit service for tests."""
 
     def __init__(self):
-        self._daily_loss = {}
+        # Unknown accounts read as the shared zero
+        self._daily_loss = defaultdict(lambda: _ZERO)
 
     def set_daily_loss(self, account_id, value: Decimal):
-        self._daily_loss[account_id] = Decimal(str(value))
+        self._daily_loss[account_id] = (
+            value if isinstance(value, Decimal) else Decimal(str(value))
+        )
 
     def get_daily_loss_current(self, account_id) -> Decimal:
-        return self._daily_loss.get(account_id, Decimal("0.00"))
+        return self._daily_loss[account_id]
+
+
+class PositionLimitServiceClient(LimitServiceClientInterface):
+    """
+    Daily loss from this backend's own closed positions (realized PnL
+    since local midnight). Served by the pos_closed_idx partial index.
+    """
+
+    def get_daily_stats(self, account_id) -> dict:
+        """
+        Today's realized PnL, closed trade count and losing trade count,
+        computed in one conditional aggregate.
+        """
+        # Range on closed_at (not closed_at__date) so the index is usable
+        day_start = timezone.make_aware(
+            datetime.combine(timezone.localdate(), time.min)
+        )
+        stats = Position.objects.filter(
+            account_id=account_id,
+            status=Position.Status.CLOSED,
+            closed_at__gte=day_start,
+        ).aggregate(
+            daily_pnl=Sum("pnl"),
+            total_trades=Count("id"),
+            losers=Count("id", filter=Q(pnl__lt=0)),
+        )
+        if stats["daily_pnl"] is None:
+            stats["daily_pnl"] = _ZERO
+        return stats
+
+    def get_daily_loss_current(self, account_id) -> Decimal:
+        daily_pnl = self.get_daily_stats(account_id)["daily_pnl"]
+        return -daily_pnl if daily_pnl < 0 else _ZERO
 
 
 class RiskGuard:
@@ -48,7 +101,7 @@ class RiskGuard:
         - Mode-aware tolerance (Ultra tighter than Semi by design in mode policy)
         """
         # 1) Max risk per trade
-        if risk_percent > Decimal(str(account.max_risk_per_trade)):
+        if risk_percent > _float_to_decimal(account.max_risk_per_trade):
             raise RiskLimitError(
                 f"Risk per trade {risk_percent}% exceeds limit {account.max_risk_per_trade}%",
                 details={"account_id": account.id, "risk_percent": str(risk_percent)},
@@ -56,13 +109,16 @@ class RiskGuard:
 
         # 2) Daily max loss check (Backend-2 mimic)
         daily_loss_current = self.limit_client.get_daily_loss_current(account.id)
-        max_daily_loss_percent = Decimal(str(account.max_daily_loss or 0))
-        if max_daily_loss_percent > 0:
-            max_daily_loss_amount = (Decimal(str(account.balance)) * max_daily_loss_percent) / Decimal(
-                "100"
-            )
+        if account.max_daily_loss and account.max_daily_loss > 0:
+            max_daily_loss_percent = _float_to_decimal(account.max_daily_loss)
+            # balance is a Decimal once loaded from the DB; unsaved instances
+            # may still hold whatever was assigned
+            balance = account.balance
+            if not isinstance(balance, Decimal):
+                balance = Decimal(str(balance))
+            max_daily_loss_amount = (balance * max_daily_loss_percent) / _HUNDRED
             # Approximate potential additional loss = risk% * balance
-            potential_loss = (Decimal(str(account.balance)) * risk_percent) / Decimal("100")
+            potential_loss = (balance * risk_percent) / _HUNDRED
             if (daily_loss_current + potential_loss) > max_daily_loss_amount:
                 raise RiskLimitError(
                     "Daily loss limit exceeded",
@@ -57,8 +57,8 @@ def close_trade(
                     status__in=[Position.Status.OPEN, Position.Status.PARTIAL]
                 )
                 error_context.update({
-                    "user_id": position.account.user.id if position.account.user else None,
-                    "account_id": position.account.id,
+                    "user_id": position.account.user_id,
+                    "account_id": position.account_id,
                     "instrument": position.instrument.symbol,
                     "current_status": position.status,
                 })
@@ -11,7 +11,7 @@ from trading.services.validation import validate_halal_trade
 from trading.services.risk import calculate_position_size, validate_leverage
 from trading.engine.logging import TradeLogger
 from trading.engine.risk_engine import RiskEngine, OrderValidationError
-from trading.services.risk_limits import RiskGuard
+from trading.services.risk_limits import PositionLimitServiceClient, RiskGuard
 from common.hooks import notify_trade_opened
 from trading.hooks import on_trade_open
 from common.exceptions import TradeValidationError, MarketDataError, RiskLimitError
@@ -58,7 +58,7 @@ def open_trade(
     """
     position = None
     error_context = {
-        "user_id": account.user.id if account.user else None,
+        "user_id": account.user_id,
         "account_id": account.id,
         "instrument": instrument.symbol,
         "side": side,
@@ -172,9 +172,14 @@ def open_trade(
                     details={**error_context, "position_size_error": str(e)}
                 )
             
-            # 8. Risk guard (daily loss, per-trade risk) before creating position
+            # 8. Risk guard (daily loss, per-trade risk) before creating position.
+            # Daily loss is today's realized PnL from this backend's positions.
             try:
-                RiskGuard().enforce(account=account, risk_percent=Decimal(str(risk_percent)), mode=mode)
+                RiskGuard(limit_client=PositionLimitServiceClient()).enforce(
+                    account=account,
+                    risk_percent=Decimal(str(risk_percent)),
+                    mode=mode,
+                )
             except RiskLimitError as e:
                 logger.warning(f"Risk guard blocked trade: {str(e)}", extra=error_context)
                 raise
@@ -0,0 +1,16 @@
+"""
+Trading model signals
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Instrument
+from .services.instruments import instrument_cache_key
+
+
+@receiver(post_save, sender=Instrument)
+@receiver(post_delete, sender=Instrument)
+def invalidate_instrument_cache(sender, instance, **kwargs):
+    """Drop the cached lookup when an instrument changes (e.g. is_halal)"""
+    cache.delete(instrument_cache_key(instance.symbol))
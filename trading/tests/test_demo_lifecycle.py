@@ -1,9 +1,13 @@
 from decimal import Decimal
+from unittest import mock
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from trading.models import TradeAccount, Instrument, Position
+from common.enums import TradeEvent
+from trading.models import TradeAccount, Instrument, Position, PositionLog
 from trading.services.trade_open import open_trade
 from trading.services.trade_close import close_trade
+from trading.services import demo
 from trading.services.demo import reset_demo_account, DEFAULT_DEMO_BALANCE
 
 
@@ -69,3 +73,81 @@ class DemoLifecycleTests(TestCase):
         position.refresh_from_db()
         self.assertEqual(position.status, Position.Status.CLOSED)
         self.assertEqual(position.remaining_size, Decimal("0"))
+
+        # History is preserved with a CLOSE event for the reset
+        close_log = PositionLog.objects.get(position=position, event_type=TradeEvent.CLOSE)
+        self.assertEqual(close_log.size, position.position_size)
+        self.assertEqual(close_log.metadata, {"reason": "demo_reset"})
+
+
+class DemoResetLogTests(TestCase):
+    """reset_demo_account writes one CLOSE log per open or partial position"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            username="demoreset",
+            email="demoreset@example.com",
+            password="testpass123",
+        )
+        self.account = TradeAccount.objects.create(
+            user=user,
+            account_type="demo",
+            balance=Decimal("5000.00"),
+            equity=Decimal("5000.00"),
+        )
+        self.instrument = Instrument.objects.create(symbol="EURUSD")
+
+    def _position(self, status, remaining_size=None):
+        return Position.objects.create(
+            account=self.account,
+            instrument=self.instrument,
+            side=Position.Side.BUY,
+            mode=Position.Mode.SEMI,
+            entry_price=Decimal("1.1000"),
+            stop_loss=Decimal("1.0950"),
+            risk_percent=1.0,
+            position_size=Decimal("2.0000"),
+            remaining_size=remaining_size,
+            status=status,
+        )
+
+    def test_reset_logs_close_events(self):
+        open_position = self._position(Position.Status.OPEN)
+        partial = self._position(Position.Status.PARTIAL, remaining_size=Decimal("0.5000"))
+        closed = self._position(Position.Status.CLOSED, remaining_size=Decimal("0"))
+
+        reset_demo_account(self.account)
+
+        logs = {log.position_id: log for log in PositionLog.objects.filter(event_type=TradeEvent.CLOSE)}
+        self.assertEqual(set(logs), {open_position.id, partial.id})
+        self.assertNotIn(closed.id, logs)
+
+        # Size closed: remaining size when set, otherwise the full position
+        self.assertEqual(logs[open_position.id].size, Decimal("2.0000"))
+        self.assertEqual(logs[partial.id].size, Decimal("0.5000"))
+
+        for log in logs.values():
+            self.assertEqual(log.account_id, self.account.id)
+            self.assertEqual(log.metadata, {"reason": "demo_reset"})
+
+    def test_position_opened_during_reset_is_left_alone(self):
+        """Only the positions read (and logged) by the reset are closed"""
+        self._position(Position.Status.OPEN)
+        close_positions = demo._close_positions
+        opened = []
+
+        def open_then_close(position_ids, closed_at):
+            # A trade opened between the read and the update
+            opened.append(self._position(Position.Status.OPEN))
+            close_positions(position_ids, closed_at)
+
+        with mock.patch.object(demo, "_close_positions", side_effect=open_then_close):
+            reset_demo_account(self.account)
+
+        late = Position.objects.get(pk=opened[0].pk)
+        self.assertEqual(late.status, Position.Status.OPEN)
+        self.assertFalse(PositionLog.objects.filter(position_id=late.id).exists())
+        self.assertEqual(
+            Position.objects.filter(account=self.account, status=Position.Status.CLOSED).count(),
+            1,
+        )
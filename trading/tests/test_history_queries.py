@@ -0,0 +1,92 @@
+"""
+Query count tests for Trade History API
+"""
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from trading.models import TradeAccount, Instrument, Position, PositionLog
+from common.enums import TradeEvent
+
+User = get_user_model()
+
+
+class TradeHistoryQueryCountTest(TestCase):
+    """History endpoint must not issue per-position queries"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username="history",
+            email="history@example.com",
+            password="testpass123"
+        )
+
+        self.account = TradeAccount.objects.create(
+            user=self.user,
+            account_type="demo",
+            balance=Decimal("1000.00"),
+            equity=Decimal("1000.00"),
+        )
+
+        self.instruments = [
+            Instrument.objects.create(symbol=symbol)
+            for symbol in ("EURUSD", "GBPUSD", "BTCUSD")
+        ]
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _create_positions(self, count):
+        for i in range(count):
+            position = Position.objects.create(
+                account=self.account,
+                instrument=self.instruments[i % len(self.instruments)],
+                side=Position.Side.BUY,
+                mode=Position.Mode.SEMI,
+                entry_price=Decimal("1.1000"),
+                stop_loss=Decimal("1.0950"),
+                risk_percent=1.0,
+                position_size=Decimal("1.0000"),
+            )
+            for event_type in (TradeEvent.OPEN, TradeEvent.CLOSE):
+                PositionLog.objects.create(
+                    position=position,
+                    event_type=event_type,
+                    price=Decimal("1.1000"),
+                )
+
+    def test_history_query_count_is_constant(self):
+        """accounts check, count, positions + instrument, prefetched logs"""
+        self._create_positions(3)
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/trade/history/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 3)
+
+        self._create_positions(6)
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/trade/history/")
+        self.assertEqual(len(response.data["results"]), 9)
+        self.assertEqual(len(response.data["results"][0]["logs"]), 2)
+
+    def test_history_without_logs_uses_annotations(self):
+        """include_logs=false skips the logs query and returns counts"""
+        self._create_positions(3)
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/trade/history/?include_logs=false")
+        self.assertEqual(response.status_code, 200)
+
+        result = response.data["results"][0]
+        self.assertNotIn("logs", result)
+        self.assertEqual(result["log_count"], 2)
+        self.assertIn(result["last_event"], (TradeEvent.OPEN, TradeEvent.CLOSE))
+
+    def test_events_do_not_join_positions(self):
+        """accounts check and one logs query, whatever the event count"""
+        self._create_positions(3)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/trade/events/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 6)
+        self.assertIn("metadata", response.data["events"][0])
@@ -0,0 +1,52 @@
+"""
+Tests for instrument lookup by symbol
+"""
+import tempfile
+from django.apps import apps
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from trading.apps import TradingConfig
+from trading.models import Instrument
+from trading.services.instruments import get_instrument_by_symbol
+from trading.signals import invalidate_instrument_cache
+
+
+class InstrumentLookupTest(TestCase):
+    """get_instrument_by_symbol must never serve a stale is_halal flag"""
+
+    def test_creates_on_first_use(self):
+        instrument = get_instrument_by_symbol("BTCUSD")
+        self.assertTrue(instrument.is_crypto)
+        self.assertTrue(instrument.is_halal)
+        self.assertEqual(Instrument.objects.filter(symbol="BTCUSD").count(), 1)
+
+    def test_per_process_cache_reads_the_row(self):
+        """With LocMemCache every lookup sees the current flag"""
+        instrument = get_instrument_by_symbol("EURUSD")
+        Instrument.objects.filter(pk=instrument.pk).update(is_halal=False)
+        self.assertFalse(get_instrument_by_symbol("EURUSD").is_halal)
+
+    def test_shared_cache_is_invalidated_on_save(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            backend = {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir,
+                }
+            }
+            with override_settings(CACHES=backend):
+                instrument = get_instrument_by_symbol("XAUUSD")
+                with self.assertNumQueries(0):
+                    get_instrument_by_symbol("XAUUSD")
+
+                instrument = Instrument.objects.get(pk=instrument.pk)
+                instrument.is_halal = False
+                instrument.save()
+                self.assertFalse(get_instrument_by_symbol("XAUUSD").is_halal)
+
+    def test_receivers_registered_by_app_config(self):
+        """Registered at startup, not by importing the API module"""
+        self.assertIsInstance(apps.get_app_config("trading"), TradingConfig)
+        connected = post_save.disconnect(invalidate_instrument_cache, sender=Instrument)
+        self.addCleanup(post_save.connect, invalidate_instrument_cache, sender=Instrument)
+        self.assertTrue(connected)
@@ -0,0 +1,69 @@
+"""
+Tests for batch position sizing
+"""
+import unittest
+from decimal import Decimal
+from django.test import SimpleTestCase
+
+from trading.services import risk
+from trading.services.risk import calculate_position_size, calculate_position_size_batch
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class PositionSizeBatchTests(SimpleTestCase):
+    def test_matches_scalar_calculation(self):
+        cases = [
+            (Decimal("10000.00"), 1.0, Decimal("1.1000"), Decimal("1.0950")),
+            (Decimal("5000.00"), 2.0, Decimal("45000"), Decimal("44000")),
+            (Decimal("2500.50"), 0.5, Decimal("150.25"), Decimal("151.75")),
+        ]
+        expected = [float(calculate_position_size(*case)) for case in cases]
+
+        sizes = calculate_position_size_batch(*zip(*cases))
+
+        np.testing.assert_allclose(sizes, expected, atol=1e-4)
+
+    def test_zero_stop_distance_is_nan(self):
+        sizes = calculate_position_size_batch([1000.0], [1.0], [1.1], [1.1])
+        self.assertTrue(np.isnan(sizes[0]))
+
+    @unittest.skipIf(risk._size_kernel is None, "Numba not installed")
+    def test_numba_kernel_matches_numpy_path(self):
+        rng = np.random.default_rng(7)
+        count = risk.NUMBA_MIN_BATCH
+        balances = rng.uniform(100, 100000, count)
+        risk_percents = rng.uniform(0.1, 5, count)
+        entries = rng.uniform(1, 50000, count)
+        stops = entries - rng.uniform(-100, 100, count)
+        stops[0] = entries[0]
+
+        jitted = calculate_position_size_batch(balances, risk_percents, entries, stops)
+        vectorized = calculate_position_size_batch(
+            balances[:-1], risk_percents[:-1], entries[:-1], stops[:-1]
+        )
+
+        np.testing.assert_allclose(jitted[:-1], vectorized, equal_nan=True)
+        self.assertTrue(np.isnan(jitted[0]))
+
+    @unittest.skipIf(risk._size_kernel is None, "Numba not installed")
+    def test_numba_kernel_broadcasts_scalars(self):
+        count = risk.NUMBA_MIN_BATCH
+        entries = np.full(count, 1.1)
+        stops = np.full(count, 1.095)
+
+        sizes = calculate_position_size_batch(10000.0, 1.0, entries, stops)
+
+        self.assertEqual(sizes.shape, (count,))
+        np.testing.assert_allclose(sizes, 20000.0)
+
+    def test_mismatched_lengths_raise(self):
+        count = risk.NUMBA_MIN_BATCH
+        ones = np.ones(count)
+
+        with self.assertRaises(ValueError):
+            calculate_position_size_batch(ones, ones[: count // 2], ones * 2, ones)
@@ -1,9 +1,16 @@
+from datetime import datetime, time, timedelta
 from decimal import Decimal
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
 from trading.models import TradeAccount, Instrument, Position
 from trading.services.trade_open import open_trade
-from trading.services.risk_limits import RiskGuard, MockLimitServiceClient
+from trading.services.risk_limits import (
+    RiskGuard,
+    MockLimitServiceClient,
+    PositionLimitServiceClient,
+)
 from common.exceptions import RiskLimitError
 
 
@@ -51,3 +58,94 @@ class RiskEnforcementTests(TestCase):
         guard = RiskGuard(limit_client=limit_client)
         self.assertTrue(guard.enforce(account=self.account, risk_percent=Decimal("1.0"), mode="ULTRA"))
         self.assertTrue(guard.enforce(account=self.account, risk_percent=Decimal("1.8"), mode="SEMI"))
+
+
+class DailyLossFromPositionsTests(TestCase):
+    """PositionLimitServiceClient reads today's realized PnL"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            username="dailyloss",
+            email="dailyloss@example.com",
+            password="testpass123",
+        )
+        self.account = TradeAccount.objects.create(
+            user=user,
+            account_type="real",
+            balance=Decimal("10000.00"),
+            equity=Decimal("10000.00"),
+            max_risk_per_trade=2.0,
+            max_daily_loss=5.0,
+        )
+        self.instrument = Instrument.objects.create(
+            symbol="EURUSD",
+            min_stop_distance=Decimal("0.0001"),
+        )
+        self.limit_client = PositionLimitServiceClient()
+        self.day_start = timezone.make_aware(
+            datetime.combine(timezone.localdate(), time.min)
+        )
+
+    def _position(self, pnl, status=Position.Status.CLOSED, closed_at=None):
+        return Position.objects.create(
+            account=self.account,
+            instrument=self.instrument,
+            side=Position.Side.BUY,
+            mode=Position.Mode.SEMI,
+            entry_price=Decimal("1.1000"),
+            stop_loss=Decimal("1.0950"),
+            risk_percent=1.0,
+            position_size=Decimal("1.0000"),
+            status=status,
+            pnl=pnl,
+            closed_at=closed_at or timezone.now(),
+        )
+
+    def test_profit_day_is_zero(self):
+        self._position(Decimal("-40.00"))
+        self._position(Decimal("100.00"))
+        self.assertEqual(self.limit_client.get_daily_loss_current(self.account.id), Decimal("0.00"))
+
+    def test_loss_day_is_positive(self):
+        self._position(Decimal("-250.00"))
+        self._position(Decimal("50.00"))
+        self.assertEqual(self.limit_client.get_daily_loss_current(self.account.id), Decimal("200.00"))
+
+    def test_local_midnight_boundary(self):
+        self._position(Decimal("-500.00"), closed_at=self.day_start - timedelta(seconds=1))
+        self._position(Decimal("-30.00"), closed_at=self.day_start)
+        self.assertEqual(self.limit_client.get_daily_loss_current(self.account.id), Decimal("30.00"))
+
+    def test_open_trade_blocked_by_realized_daily_loss(self):
+        # 600 lost today is above 5% of 10k
+        self._position(Decimal("-600.00"))
+        with self.assertRaisesMessage(RiskLimitError, "Daily loss limit exceeded"):
+            open_trade(
+                account=self.account,
+                instrument=self.instrument,
+                side=Position.Side.BUY,
+                mode="SEMI",
+                entry_price=Decimal("1.1000"),
+                stop_loss=Decimal("1.0950"),
+                risk_percent=1.0,
+            )
+
+    def test_daily_stats_aggregate(self):
+        self._position(Decimal("-120.00"))
+        self._position(Decimal("-30.00"))
+        self._position(Decimal("80.00"))
+        self._position(Decimal("0.00"))
+        # Neither counts: still open, and closed before today
+        self._position(Decimal("-999.00"), status=Position.Status.OPEN)
+        self._position(Decimal("-999.00"), closed_at=self.day_start - timedelta(hours=1))
+
+        with self.assertNumQueries(1):
+            stats = self.limit_client.get_daily_stats(self.account.id)
+
+        self.assertEqual(stats["daily_pnl"], Decimal("-70.00"))
+        self.assertEqual(stats["total_trades"], 4)
+        self.assertEqual(stats["losers"], 2)
+
+    def test_daily_stats_without_trades(self):
+        stats = self.limit_client.get_daily_stats(self.account.id)
+        self.assertEqual(stats, {"daily_pnl": Decimal("0.00"), "total_trades": 0, "losers": 0})
@@ -4,10 +4,11 @@ Tests for Trade History Logging
 from decimal import Decimal
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
 from trading.models import TradeAccount, Instrument, Position, PositionLog
 from trading.services.trade_open import open_trade
 from trading.services.trade_close import close_trade
-from trading.engine.logging import TradeLogger
+from trading.engine.logging import PositionLogBuffer, TradeLogger
 from common.enums import TradeEvent
 
 User = get_user_model()
@@ -135,3 +136,81 @@ class TradeLoggingTest(TestCase):
         
         log = logs.first()
         self.assertEqual(log.size, partial_size)
+
+
+class PositionLogBufferTest(TestCase):
+    """Test batched PositionLog writes"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username="buffer",
+            email="buffer@example.com",
+            password="testpass123"
+        )
+        account = TradeAccount.objects.create(
+            user=self.user,
+            account_type="demo",
+            balance=Decimal("1000.00"),
+            equity=Decimal("1000.00"),
+        )
+        self.position = Position.objects.create(
+            account=account,
+            instrument=Instrument.objects.create(symbol="EURUSD"),
+            side=Position.Side.BUY,
+            mode=Position.Mode.SEMI,
+            entry_price=Decimal("1.1000"),
+            stop_loss=Decimal("1.0950"),
+            risk_percent=1.0,
+            position_size=Decimal("1.0000"),
+        )
+
+    def test_rows_written_on_exit(self):
+        """Buffered events are inserted together when the block ends"""
+        with PositionLogBuffer() as buffer:
+            for _ in range(3):
+                TradeLogger.log_event(
+                    position=self.position,
+                    event_type=TradeEvent.MODIFIED,
+                    buffer=buffer,
+                )
+            self.assertEqual(PositionLog.objects.count(), 0)
+        self.assertEqual(PositionLog.objects.count(), 3)
+
+    def test_flush_at_batch_size(self):
+        """Reaching batch_size flushes without waiting for the block end"""
+        with PositionLogBuffer(batch_size=2) as buffer:
+            for _ in range(3):
+                buffer.append(position=self.position, event_type=TradeEvent.MODIFIED)
+            self.assertEqual(PositionLog.objects.count(), 2)
+            self.assertEqual(len(buffer), 1)
+        self.assertEqual(PositionLog.objects.count(), 3)
+
+    def test_error_discards_pending(self):
+        """Nothing is written when the block raises"""
+        with self.assertRaises(ValueError):
+            with PositionLogBuffer() as buffer:
+                buffer.append(position=self.position, event_type=TradeEvent.MODIFIED)
+                raise ValueError
+        self.assertEqual(PositionLog.objects.count(), 0)
+
+    def test_account_copied_from_position(self):
+        """Logs carry the position's account for join-free filtering"""
+        log = TradeLogger.log_event(position=self.position, event_type=TradeEvent.MODIFIED)
+        direct = PositionLog.objects.create(position=self.position, event_type=TradeEvent.MODIFIED)
+        self.assertEqual(log.account_id, self.position.account_id)
+        self.assertEqual(direct.account_id, self.position.account_id)
+
+    def test_buffered_log_visible_in_events(self):
+        """Buffered rows get the account too (bulk_create skips save())"""
+        with PositionLogBuffer() as buffer:
+            buffer.append(position=self.position, event_type=TradeEvent.MODIFIED)
+
+        log = PositionLog.objects.get()
+        self.assertEqual(log.account_id, self.position.account_id)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.get("/api/trade/events/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)